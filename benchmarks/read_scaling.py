@@ -0,0 +1,98 @@
+"""
+Throughput of list() and find() as reader threads are added.
+
+Every thread calls the same TravelService, backed by a scoped unit of work,
+so each one reads through its own read-only connection. On a free-threaded
+build (python3.13t) record hydration runs in parallel too, and throughput
+should scale with cores; with the GIL only time spent inside SQLite does.
+
+    PYTHONPATH=src python benchmarks/read_scaling.py --rows 5000 --threads 1 2 4 8
+"""
+
+import argparse
+import datetime as dt
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from folio.services import TravelService
+from folio.uow import SQLiteUnitOfWork
+
+
+def seed(service: TravelService, rows: int) -> None:
+    start = dt.date(2000, 1, 1)
+    with service.batch():
+        for i in range(rows):
+            service.add("CAN", "USA", start + dt.timedelta(days=i))
+
+
+def run(service: TravelService, threads: int, seconds: float) -> dict[str, float]:
+    """
+    Run the report workload on `threads` threads and return calls per second
+    """
+    counts = {"list": 0, "find": 0}
+    lock = threading.Lock()
+    go = threading.Barrier(threads + 1)
+    deadline = 0.0
+
+    def work(n: int) -> None:
+        done = {"list": 0, "find": 0}
+        day = dt.date(2000, 1, 1) + dt.timedelta(days=n)
+        go.wait()
+        while time.perf_counter() < deadline:
+            service.list()
+            done["list"] += 1
+            for _ in range(10):
+                service.find(date=day)
+                done["find"] += 1
+        with lock:
+            for name, count in done.items():
+                counts[name] += count
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    deadline = time.perf_counter() + seconds
+    go.wait()
+    for worker in workers:
+        worker.join()
+    return {name: count / seconds for name, count in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{os.cpu_count()} CPUs, {args.rows} rows\n")
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    uow = SQLiteUnitOfWork.scoped(path, size=max(args.threads), profile="read-mostly")
+    try:
+        service = TravelService(uow)
+        seed(service, args.rows)
+
+        baseline = None
+        print(f"{'threads':>7} {'list/s':>10} {'find/s':>10} {'speedup':>8}")
+        for threads in args.threads:
+            rates = run(service, threads, args.seconds)
+            # Each round of the workload is one list() and ten find() calls
+            baseline = baseline or rates["list"]
+            print(
+                f"{threads:>7} {rates['list']:>10.1f} {rates['find']:>10.1f}"
+                f" {rates['list'] / baseline:>7.2f}x"
+            )
+    finally:
+        uow.close()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,11 @@ from .common import ValidationResult
 from .protocols import Validator, Serializer, Formatter
 from .serializers import SerializeStrategy, JSONSerializer, DictSerializer
 from .utils import normalize_date
-from .exceptions import DuplicateRecordError
+from .exceptions import (
+    DuplicateRecordError,
+    UnitOfWorkClosedError,
+    PoolTimeoutError,
+)
 
 __all__ = [
     "ValidationResult",
@@ -14,4 +18,6 @@ __all__ = [
     "DictSerializer",
     "normalize_date",
     "DuplicateRecordError",
+    "UnitOfWorkClosedError",
+    "PoolTimeoutError",
 ]
@@ -4,3 +4,11 @@ class DomainError(Exception):
 
 class DuplicateRecordError(DomainError):
     """Raised when attempting to isnert a recors that already exists."""
+
+
+class UnitOfWorkClosedError(RuntimeError):
+    """Raised when a repository is used after its unit of work has closed."""
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection becomes free in time."""
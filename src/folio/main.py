@@ -1,9 +1,9 @@
-from folio.uow import TravelSQLiteUoW
+from folio.uow import SQLiteUnitOfWork
 from folio.services import TravelService
 
 
 def main():
-    uow = TravelSQLiteUoW()
+    uow = SQLiteUnitOfWork()
     service = TravelService(uow)
 
     try:
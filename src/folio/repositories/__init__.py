@@ -1,15 +1,49 @@
 from .base import Repository
+from .cached import CachedRepository, RecordCache, RecordCacheStats
 
 from .sql.sqlite_travel_repository import SQLiteTravelRepository
 from .sql.sqlite_employment_repository import SQLiteEmploymentRepository
 from .sql.sqlite_address_repository import SQLiteAddressRepository
 from .sql.sqlite_work_repository import SQLiteWorkRepository
 from .sql.sqlite import SQLiteRepository
-
+from .sql.pagination import Page
+from .sql.query import Query
+from .sql.schema import Index
+from .sql.migrations import (
+    Migration,
+    MIGRATIONS,
+    migrate,
+    date_encoding,
+    convert_dates,
+)
+from .sql.dates import DateEncoding
+from .sql.retry import RetryPolicy, ContentionStats
+from .sql.statements import (
+    StatementCache,
+    StatementCacheStats,
+    CONNECTION_STATEMENT_CACHE_SIZE,
+)
 
 __all__ = [
     "Repository",
+    "CachedRepository",
+    "RecordCache",
+    "RecordCacheStats",
     "SQLiteRepository",
+    "Page",
+    "Query",
+    "Index",
+    "Migration",
+    "MIGRATIONS",
+    "migrate",
+    "date_encoding",
+    "convert_dates",
+    "DateEncoding",
+    "RetryPolicy",
+    "ContentionStats",
+    "StatementCache",
+    "StatementCacheStats",
+    "CONNECTION_STATEMENT_CACHE_SIZE",
     "SQLiteTravelRepository",
     "SQLiteEmploymentRepository",
     "SQLiteAddressRepository",
@@ -0,0 +1,199 @@
+import copy
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, List, Optional
+
+from folio.models import R
+from .base import Repository
+from .sql.counters import ThreadCounters
+
+DEFAULT_RECORD_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class RecordCacheStats:
+    hits: int
+    misses: int
+    # Entries dropped to stay within maxsize
+    evictions: int
+    # Entries dropped because their table was written to or changed
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Store:
+    """
+    The cached records of one connection, least recently used first
+    """
+
+    def __init__(self, source: Any):
+        self.source = source
+        self.entries: OrderedDict[tuple[str, int], Any] = OrderedDict()
+        # PRAGMA data_version when the entries were last known to be current
+        self.version: Optional[int] = None
+
+    def drop(self, table: Optional[str] = None) -> int:
+        if table is None:
+            dropped = len(self.entries)
+            self.entries.clear()
+            return dropped
+        keys = [key for key in self.entries if key[0] == table]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+
+class RecordCache:
+    """
+    Records fetched by get(), kept in a bounded LRU keyed by (table, id).
+
+    Each connection has its own `maxsize` entries: a connection only ever
+    serves records it read itself, so it never sees another connection's
+    uncommitted writes, nor rows its own rolled back transaction changed.
+    One cache is meant to be shared by every CachedRepository of a database.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_RECORD_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._stores: dict[Hashable, _Store] = {}
+        self._lock = threading.Lock()
+        self._counters = ThreadCounters("hits", "misses", "evictions", "invalidations")
+
+    def stats(self) -> RecordCacheStats:
+        totals = self._counters.totals()
+        with self._lock:
+            size = sum(len(store.entries) for store in self._stores.values())
+        return RecordCacheStats(size=size, **totals)
+
+    def clear(self) -> None:
+        with self._lock:
+            for store in self._stores.values():
+                store.drop()
+            self._counters.reset()
+
+    def _store(self, source: Any) -> _Store:
+        # Connections cannot be weakly referenced, so stores of closed ones
+        # are dropped whenever a new connection shows up
+        with self._lock:
+            store = self._stores.get(id(source))
+            if store is None or store.source is not source:
+                self._prune()
+                store = self._stores[id(source)] = _Store(source)
+            return store
+
+    def _prune(self) -> None:
+        for key, store in list(self._stores.items()):
+            if isinstance(store.source, sqlite3.Connection):
+                try:
+                    store.source.total_changes
+                except sqlite3.ProgrammingError:
+                    del self._stores[key]
+
+
+class CachedRepository(Repository[R]):
+    """
+    A read-through cache in front of any repository's get().
+
+    A cached record is served without a query or row hydration, as long as
+    the database has not changed since it was read: any write through this
+    repository drops the table's cached records, and for SQLite
+    repositories, a change of PRAGMA data_version (a commit by another
+    connection) drops every record cached for the connection. Until a write
+    is committed, get() bypasses the cache, so a rollback leaves nothing
+    stale behind. Writes made outside the repository, such as raw SQL on its
+    connection, are not seen.
+
+    Only the methods in WRITES (and add()) count as writes; every other
+    attribute passes straight through to the repository.
+    """
+
+    WRITES = frozenset(
+        {"add_many", "upsert", "update", "update_many", "delete", "delete_many"}
+    )
+
+    def __init__(self, repository: Repository[R], cache: RecordCache):
+        self.repository = repository
+        self.cache = cache
+        self.table = getattr(repository, "_table", type(repository).__name__.lower())
+        self._conn = getattr(repository, "conn", None)
+        self._store = cache._store(self._conn or repository)
+        self._dirty = False
+
+    def add(self, record: R) -> int:
+        self._wrote()
+        return self.repository.add(record)
+
+    def get(self, id_: int) -> Optional[R]:
+        # A closed repository raises, and its connection may be in use again
+        if self._bypass() or getattr(self.repository, "_closed", False):
+            return self.repository.get(id_)
+
+        self._check_version()
+        key = (self.table, id_)
+        entries = self._store.entries
+        try:
+            record = entries[key]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(key)
+            self.cache._counters.add("hits")
+            # Records are mutable, so callers never get the cached instance
+            return copy.copy(record)
+
+        self.cache._counters.add("misses")
+        record = self.repository.get(id_)
+        if record is not None:
+            entries[key] = copy.copy(record)
+            if len(entries) > self.cache.maxsize:
+                entries.popitem(last=False)
+                self.cache._counters.add("evictions")
+        return record
+
+    def list(self) -> List[R]:
+        return self.repository.list()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.repository, name)
+        if name not in self.WRITES:
+            return attribute
+
+        def write(*args, **kwargs):
+            self._wrote()
+            return attribute(*args, **kwargs)
+
+        return write
+
+    def _wrote(self) -> None:
+        # The table's records were already dropped by this transaction's
+        # first write, and none were cached since
+        if not self._bypass():
+            self._invalidate(self.table)
+        self._dirty = True
+
+    def _bypass(self) -> bool:
+        if self._dirty and self._conn is not None and not self._conn.in_transaction:
+            self._dirty = False
+        return self._dirty and self._conn is not None
+
+    def _check_version(self) -> None:
+        if self._conn is None:
+            return
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._store.version:
+            self._invalidate()
+            self._store.version = version
+
+    def _invalidate(self, table: Optional[str] = None) -> None:
+        dropped = self._store.drop(table)
+        if dropped:
+            self.cache._counters.add("invalidations", dropped)
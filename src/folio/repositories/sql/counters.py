@@ -0,0 +1,47 @@
+import threading
+from typing import Union
+
+Number = Union[int, float]
+
+
+class ThreadCounters:
+    """
+    Statistics counters that threads update without sharing a lock.
+
+    Each thread increments counters of its own, so hot paths such as
+    statement cache hits neither contend on a lock nor lose updates when run
+    in parallel on a free-threaded build. Only reading the totals, and a
+    thread's first update, take the lock.
+    """
+
+    def __init__(self, *names: str):
+        self.names = names
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Kept after their thread exits, as its counts are part of the totals
+        self._slots: list[list[Number]] = []
+
+    def add(self, name: str, amount: Number = 1) -> None:
+        slot = self._slot()
+        slot[self.names.index(name)] += amount
+
+    def totals(self) -> dict[str, Number]:
+        with self._lock:
+            return {
+                name: sum(slot[i] for slot in self._slots)
+                for i, name in enumerate(self.names)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            for slot in self._slots:
+                slot[:] = [0] * len(self.names)
+
+    def _slot(self) -> list[Number]:
+        try:
+            return self._local.slot
+        except AttributeError:
+            slot = self._local.slot = [0] * len(self.names)
+            with self._lock:
+                self._slots.append(slot)
+            return slot
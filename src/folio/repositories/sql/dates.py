@@ -0,0 +1,62 @@
+import sqlite3
+import datetime as dt
+from enum import Enum
+from typing import Any
+
+from folio.common import normalize_date
+
+
+class DateEncoding(Enum):
+    """
+    How date columns are stored: ISO 8601 TEXT, or INTEGER day ordinals
+    (datetime.date.toordinal(), day 1 being 0001-01-01) in DAYNUM columns.
+    """
+
+    ISO = "iso"
+    ORDINAL = "ordinal"
+
+
+# Declared type of ordinal date columns. It has NUMERIC affinity, so values
+# are stored as integers, and names the converter registered below
+DAYNUM = "DAYNUM"
+
+# Offset between date ordinals and SQLite Julian day numbers
+JULIAN_OFFSET = 1721424.5
+
+# Replaces the default date adapter deprecated in Python 3.12
+sqlite3.register_adapter(dt.date, dt.date.isoformat)
+sqlite3.register_converter(DAYNUM, lambda value: dt.date.fromordinal(int(value)))
+
+
+def to_date(value: Any) -> dt.date:
+    """
+    Convert a stored date column value into a datetime.date
+    """
+    if isinstance(value, str):
+        return dt.date.fromisoformat(value)
+    if isinstance(value, int):
+        return dt.date.fromordinal(value)
+    return value
+
+
+def encode_date(value: dt.date | str, encoding: DateEncoding) -> str | int:
+    """
+    Convert a date, or a YYYY-MM-DD string, into its stored representation
+    """
+    if isinstance(value, str):
+        try:
+            value = dt.date.fromisoformat(value)
+        except ValueError:
+            value = normalize_date(value)
+    if encoding is DateEncoding.ORDINAL:
+        return value.toordinal()
+    return value.isoformat()
+
+
+def date_sql(column: str, encoding: DateEncoding) -> str:
+    """
+    SQL expression that SQLite's date functions accept for a date column
+    """
+    if encoding is DateEncoding.ORDINAL:
+        return f"({column} + {JULIAN_OFFSET})"
+    return column
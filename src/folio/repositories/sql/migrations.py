@@ -0,0 +1,267 @@
+import re
+import sqlite3
+from dataclasses import dataclass
+
+from .dates import DateEncoding, DAYNUM, JULIAN_OFFSET
+
+from .sqlite_travel_repository import SQLiteTravelRepository
+from .sqlite_employment_repository import SQLiteEmploymentRepository
+from .sqlite_address_repository import SQLiteAddressRepository
+from .sqlite_work_repository import SQLiteWorkRepository
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One numbered schema step. Applied migrations are tracked through
+    PRAGMA user_version, so a step runs at most once per database file.
+    """
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+# Tables use IF NOT EXISTS so that files created before schema versioning
+# (user_version 0, tables already present) migrate cleanly
+TRAVEL_TABLE = """
+CREATE TABLE IF NOT EXISTS travel (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    date TEXT NOT NULL,
+    notes TEXT,
+    CHECK(length(origin) = 3 AND origin = UPPER(origin)),
+    CHECK(length(destination) = 3 AND destination = UPPER(destination)),
+    UNIQUE(origin, destination, date)
+)
+"""
+
+EMPLOYMENT_TABLE = """
+CREATE TABLE IF NOT EXISTS employment (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start TEXT NOT NULL,
+    end TEXT,
+    company TEXT NOT NULL,
+    supervisor TEXT NOT NULL,
+    address TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    CHECK(end IS NULL OR end >= start),
+    UNIQUE(company, start)
+)
+"""
+
+ADDRESS_TABLE = """
+CREATE TABLE IF NOT EXISTS address (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start TEXT NOT NULL,
+    end TEXT,
+    street TEXT NOT NULL,
+    city TEXT NOT NULL,
+    province TEXT,
+    country TEXT NOT NULL,
+    postal_code TEXT NOT NULL,
+    CHECK(end is NULL OR end >= start),
+    UNIQUE(street, city, start, end)
+)
+"""
+
+WORK_TABLE = """
+CREATE TABLE IF NOT EXISTS work (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    year INTEGER,
+    genre TEXT,
+    is_read INTEGER NOT NULL CHECK(is_read IN (0,1)),
+    UNIQUE(title, author, year)
+)
+"""
+
+# Indexes declared on the repositories' INDEXES when migration 2 was written
+INDEXES_V2 = (
+    "CREATE INDEX IF NOT EXISTS travel_date ON travel (date)",
+    "CREATE INDEX IF NOT EXISTS travel_destination ON travel (destination, date)",
+    "CREATE INDEX IF NOT EXISTS employment_start ON employment (start)",
+    "CREATE INDEX IF NOT EXISTS address_open ON address (start) WHERE end IS NULL",
+    "CREATE INDEX IF NOT EXISTS work_author ON work (author)",
+    "CREATE INDEX IF NOT EXISTS work_genre ON work (genre)",
+)
+
+# Open addresses (end IS NULL) were never deduplicated by the table's UNIQUE
+# constraint, so duplicates are dropped, keeping the first, before the key
+# that covers them is created
+ADDRESS_OPEN_UNIQUE_V3 = (
+    """
+    DELETE FROM address
+    WHERE end IS NULL AND id NOT IN (
+        SELECT MIN(id) FROM address WHERE end IS NULL GROUP BY street, city, start
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS address_open_unique "
+    "ON address (street, city, start) WHERE end IS NULL",
+)
+
+# Append new steps with the next version number; never edit applied ones.
+# Statements are literal SQL so that applied steps cannot change: a new or
+# changed INDEXES declaration needs a step of its own.
+MIGRATIONS = (
+    Migration(
+        1,
+        "Create record tables",
+        (TRAVEL_TABLE, EMPLOYMENT_TABLE, ADDRESS_TABLE, WORK_TABLE),
+    ),
+    Migration(2, "Add secondary indexes", INDEXES_V2),
+    Migration(3, "Make open addresses unique", ADDRESS_OPEN_UNIQUE_V3),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(
+    conn: sqlite3.Connection, migrations: tuple[Migration, ...] = MIGRATIONS
+) -> int:
+    """
+    Apply pending migrations in order and return the resulting schema version.
+
+    Up-to-date databases cost a single PRAGMA read. Otherwise the steps run
+    in one IMMEDIATE transaction, so concurrent processes cannot apply the
+    same step twice.
+    """
+    latest = max((m.version for m in migrations), default=0)
+    current = schema_version(conn)
+    if current >= latest:
+        return current
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock, another connection may have migrated
+        current = schema_version(conn)
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version <= current:
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {migration.version:d}")
+            current = migration.version
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return current
+
+
+# Repositories whose tables hold DATE_FIELDS columns
+DATED_REPOSITORIES = (
+    SQLiteTravelRepository,
+    SQLiteEmploymentRepository,
+    SQLiteAddressRepository,
+)
+
+DATE_COLUMN_TYPES = {DateEncoding.ISO: "TEXT", DateEncoding.ORDINAL: DAYNUM}
+
+
+def date_encoding(conn: sqlite3.Connection) -> DateEncoding:
+    """
+    Detect how a migrated database stores dates from its declared column types
+    """
+    repository = DATED_REPOSITORIES[0]
+    table = repository.RECORD_TYPE.__name__.lower()
+    for _, name, declared, *_ in conn.execute(f"PRAGMA table_info({table})"):
+        if name == repository.DATE_FIELDS[0]:
+            return DateEncoding.ORDINAL if declared == DAYNUM else DateEncoding.ISO
+    raise LookupError(f"Database has no {table} table; run migrate() first")
+
+
+def convert_dates(conn: sqlite3.Connection, encoding: DateEncoding) -> DateEncoding:
+    """
+    Rewrite every date column of a migrated database into `encoding`.
+
+    SQLite cannot change a column's declared type in place, so each table is
+    rebuilt: copied into a new table with the converted values, swapped in,
+    and given back its indexes and AUTOINCREMENT sequence. Does nothing when
+    the database already uses `encoding`.
+    """
+    if date_encoding(conn) is encoding:
+        return encoding
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another connection may have converted it while this one waited
+        if date_encoding(conn) is encoding:
+            conn.execute("COMMIT")
+            return encoding
+        for repository in DATED_REPOSITORIES:
+            _rebuild_dates(conn, repository, encoding)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return encoding
+
+
+def _rebuild_dates(conn, repository, encoding: DateEncoding) -> None:
+    table = repository.RECORD_TYPE.__name__.lower()
+    staging = f"{table}_dates_rebuild"
+    (table_sql,) = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    index_sql = [
+        row[0]
+        for row in conn.execute(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+    ]
+    sequence = conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+    ).fetchone()
+
+    new_type = DATE_COLUMN_TYPES[encoding]
+    # ALTER TABLE ... RENAME stores the new name quoted
+    table_sql = re.sub(
+        rf'^CREATE TABLE "?{table}\b"?', f"CREATE TABLE {staging}", table_sql
+    )
+    for field in repository.DATE_FIELDS:
+        table_sql = re.sub(
+            rf"\b{field} (TEXT|{DAYNUM})\b", f"{field} {new_type}", table_sql
+        )
+
+    if encoding is DateEncoding.ORDINAL:
+        convert = "CAST(julianday({column}) - {offset} AS INTEGER)"
+    else:
+        convert = "date({column} + {offset})"
+    columns = ("id", *repository.VALID_FIELDS)
+    selected = [
+        (
+            convert.format(column=column, offset=JULIAN_OFFSET)
+            if column in repository.DATE_FIELDS
+            else column
+        )
+        for column in columns
+    ]
+
+    conn.execute(table_sql)
+    conn.execute(
+        f"INSERT INTO {staging} ({', '.join(columns)}) "
+        f"SELECT {', '.join(selected)} FROM {table}"
+    )
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    for sql in index_sql:
+        conn.execute(sql)
+    if sequence is not None:
+        updated = conn.execute(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?",
+            (sequence[0], table),
+        )
+        if not updated.rowcount:
+            conn.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)",
+                (table, sequence[0]),
+            )
@@ -0,0 +1,50 @@
+import json
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from folio.models import R
+
+
+@dataclass(frozen=True)
+class Page[R]:
+    """
+    One page of records and the cursor to pass as `after` to fetch the next
+    page. `next_cursor` is None on the last page.
+    """
+
+    records: List[R]
+    next_cursor: Optional[str]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+
+def encode_cursor(order_by: str, key: List[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+    """
+    payload = json.dumps({"order_by": order_by, "key": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, order_by: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor() for the same ordering.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key = payload["key"]
+        cursor_order = payload["order_by"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+
+    if cursor_order != order_by:
+        raise ValueError(
+            f"Cursor was created for order_by={cursor_order!r}, not {order_by!r}"
+        )
+    return key
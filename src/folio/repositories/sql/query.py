@@ -0,0 +1,285 @@
+from collections import namedtuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
+
+from folio.models import R
+from .dates import date_sql, to_date
+
+if TYPE_CHECKING:
+    from .sqlite import SQLiteRepository
+
+
+COMPARISONS = {
+    "exact": "=",
+    "ne": "!=",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+    "like": "LIKE",
+}
+
+AGGREGATES = ("count", "min", "max", "sum", "avg")
+
+# Group-by transforms, applied to a field as `field__transform`
+TRANSFORMS = {
+    "year": "CAST(strftime('%Y', {column}) AS INTEGER)",
+    "month": "CAST(strftime('%m', {column}) AS INTEGER)",
+}
+
+
+@dataclass(frozen=True)
+class Query[R]:
+    """
+    A lazy, chainable SELECT over a SQLiteRepository.
+
+    Each call returns a new Query; nothing is sent to SQLite until the query
+    is iterated, counted, indexed or fetched with all()/first(). Filters use
+    `field__lookup=value` keywords, where lookup is one of exact (default),
+    ne, lt, lte, gt, gte, like, in, between or isnull:
+
+        repo.query().where(date__between=(a, b), destination__in=["MEX", "USA"])
+            .order_by("-date").limit(20)
+    """
+
+    repository: "SQLiteRepository[R]"
+    conditions: tuple[str, ...] = ()
+    params: tuple[Any, ...] = ()
+    ordering: tuple[str, ...] = ()
+    limit_: Optional[int] = None
+    offset_: Optional[int] = None
+
+    def where(self, **lookups) -> "Query[R]":
+        conditions = list(self.conditions)
+        params = list(self.params)
+        for key, value in lookups.items():
+            condition, values = self._compile_lookup(key, value)
+            conditions.append(condition)
+            params.extend(values)
+        return replace(self, conditions=tuple(conditions), params=tuple(params))
+
+    def order_by(self, *fields: str) -> "Query[R]":
+        ordering = []
+        for field in fields:
+            column = self._column(field.removeprefix("-"))
+            ordering.append(f"{column} DESC" if field.startswith("-") else column)
+        return replace(self, ordering=tuple(ordering))
+
+    def limit(self, count: int) -> "Query[R]":
+        if count < 0:
+            raise ValueError(f"limit must not be negative, got {count}")
+        return replace(self, limit_=count)
+
+    def offset(self, count: int) -> "Query[R]":
+        if count < 0:
+            raise ValueError(f"offset must not be negative, got {count}")
+        return replace(self, offset_=count)
+
+    def __iter__(self) -> Iterator[R]:
+        sql, params = self._compile(self.repository.columns)
+        return self.repository._iter_rows(sql, params)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Query slices do not support a step")
+            start = index.start or 0
+            if start < 0 or (index.stop is not None and index.stop < 0):
+                raise ValueError("Query slices do not support negative indices")
+            # Slices index into the rows this query already returns, so they
+            # stay within an existing limit
+            stop = index.stop
+            if self.limit_ is not None:
+                stop = self.limit_ if stop is None else min(stop, self.limit_)
+            query = self.offset((self.offset_ or 0) + start)
+            if stop is not None:
+                query = query.limit(max(stop - start, 0))
+            return query
+
+        if index < 0:
+            raise IndexError("Query does not support negative indices")
+        records = self[index : index + 1].all()
+        if not records:
+            raise IndexError("Query index out of range")
+        return records[0]
+
+    def all(self) -> List[R]:
+        return list(self)
+
+    def first(self) -> Optional[R]:
+        return next(iter(self[0:1]), None)
+
+    def count(self) -> int:
+        if self.limit_ is None and self.offset_ is None:
+            sql, params = self._compile("COUNT(*)", ordered=False)
+        else:
+            inner, params = self._compile("1", ordered=False)
+            sql = f"SELECT COUNT(*) FROM ({inner})"
+        return self.repository._execute(sql, params).fetchone()[0]
+
+    def exists(self) -> bool:
+        inner, params = self._compile("1", ordered=False)
+        return bool(
+            self.repository._execute(f"SELECT EXISTS({inner})", params).fetchone()[0]
+        )
+
+    def values(self, *fields: str, distinct: bool = False) -> List[tuple]:
+        """
+        Return only `fields` (all fields by default) as named tuples of column
+        values, without building records. Dates come back as datetime.date
+        whatever their storage encoding.
+        """
+        fields = fields or self.repository.VALID_FIELDS
+        row_type = _row_type(fields)
+        return [row_type._make(row) for row in self._fetch(fields, distinct)]
+
+    def values_list(
+        self, *fields: str, flat: bool = False, distinct: bool = False
+    ) -> List[Any]:
+        """
+        Return only `fields` as plain tuples of column values, or as bare
+        values when `flat` is set and a single field is requested.
+        """
+        if flat and len(fields) != 1:
+            raise ValueError("values_list(flat=True) requires exactly one field")
+        fields = fields or self.repository.VALID_FIELDS
+        rows = self._fetch(fields, distinct)
+        return [row[0] for row in rows] if flat else rows
+
+    def aggregate(
+        self,
+        group_by: str | tuple[str, ...] = (),
+        metrics: dict[str, str | tuple[str, str]] | None = None,
+    ) -> List[tuple]:
+        """
+        Compute `metrics` in SQLite, one named tuple per `group_by` group.
+
+        `metrics` maps result names to (function, field) pairs, where function
+        is one of count, min, max, sum or avg and field may be "*" for count;
+        a bare "count" is shorthand for ("count", "*"). Group-by fields accept
+        the `__year` and `__month` transforms on date columns:
+
+            repo.query().aggregate(
+                group_by=("destination", "date__year"),
+                metrics={"trips": "count", "first": ("min", "date")},
+            )
+        """
+        group_by = (group_by,) if isinstance(group_by, str) else tuple(group_by)
+        metrics = metrics or {"count": "count"}
+
+        selected = [self._expression(field) for field in group_by]
+        # Plain date columns and MIN/MAX over them return dates
+        dates = [field in self.repository.DATE_FIELDS for field in group_by]
+        for name, metric in metrics.items():
+            function, field = ("count", "*") if metric == "count" else metric
+            if function not in AGGREGATES:
+                raise ValueError(f"Unsupported aggregate: {function}")
+            column = (
+                "*" if field == "*" and function == "count" else self._column(field)
+            )
+            selected.append(f"{function.upper()}({column})")
+            dates.append(
+                function in ("min", "max") and field in self.repository.DATE_FIELDS
+            )
+
+        sql, params = self._compile(", ".join(selected), ordered=False)
+        if group_by:
+            positions = ", ".join(str(i) for i in range(1, len(group_by) + 1))
+            sql += f" GROUP BY {positions} ORDER BY {positions}"
+
+        cursor = self.repository._execute(sql, params)
+        cursor.row_factory = None
+        row_type = _row_type((*group_by, *metrics))
+        return [row_type._make(row) for row in _dates(cursor.fetchall(), dates)]
+
+    def _expression(self, field: str) -> str:
+        field, _, transform = field.partition("__")
+        column = self._column(field)
+        if not transform:
+            return column
+        if transform not in TRANSFORMS:
+            raise ValueError(f"Unsupported transform: {transform}")
+        if field in self.repository.DATE_FIELDS:
+            column = date_sql(column, self.repository.date_encoding)
+        return TRANSFORMS[transform].format(column=column)
+
+    def _fetch(self, fields: tuple[str, ...], distinct: bool) -> List[tuple]:
+        columns = ", ".join(self._column(field) for field in fields)
+        sql, params = self._compile(f"DISTINCT {columns}" if distinct else columns)
+        cursor = self.repository._execute(sql, params)
+        cursor.row_factory = None
+        dates = [field in self.repository.DATE_FIELDS for field in fields]
+        return _dates(cursor.fetchall(), dates)
+
+    def _compile(self, select: str, ordered: bool = True) -> tuple[str, List[Any]]:
+        sql = f"SELECT {select} FROM {self.repository._table_name}"
+        params = list(self.params)
+        if self.conditions:
+            sql += " WHERE " + " AND ".join(self.conditions)
+        if ordered and self.ordering:
+            sql += " ORDER BY " + ", ".join(self.ordering)
+        if self.limit_ is not None or self.offset_ is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend(
+                [-1 if self.limit_ is None else self.limit_, self.offset_ or 0]
+            )
+        return sql, params
+
+    def _compile_lookup(self, key: str, value: Any) -> tuple[str, List[Any]]:
+        field, _, lookup = key.partition("__")
+        column = self._column(field)
+        lookup = lookup or "exact"
+
+        if lookup == "isnull":
+            return f"{column} IS {'' if value else 'NOT '}NULL", []
+
+        if lookup in ("exact", "ne") and value is None:
+            return f"{column} IS {'' if lookup == 'exact' else 'NOT '}NULL", []
+
+        if lookup == "in":
+            values = [self._normalize(field, v) for v in value]
+            if not values:
+                return "0", []
+            return f"{column} IN ({', '.join('?' * len(values))})", values
+
+        if lookup == "between":
+            low, high = value
+            return f"{column} BETWEEN ? AND ?", [
+                self._normalize(field, low),
+                self._normalize(field, high),
+            ]
+
+        if lookup not in COMPARISONS:
+            raise ValueError(f"Unsupported lookup: {lookup}")
+        return f"{column} {COMPARISONS[lookup]} ?", [self._normalize(field, value)]
+
+    def _column(self, field: str) -> str:
+        if field != "id" and field not in self.repository.VALID_FIELDS:
+            raise ValueError(f"Invalid field: {field}")
+        return field
+
+    def _normalize(self, field: str, value: Any) -> Any:
+        return self.repository._normalize_value(field, value)
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: tuple[str, ...]) -> type:
+    return namedtuple("Row", fields)
+
+
+def _dates(rows: List[tuple], dates: List[bool]) -> List[tuple]:
+    """
+    Convert the values in `rows` at the positions flagged in `dates`, stored
+    as ISO text or day ordinals, into datetime.date
+    """
+    positions = [position for position, is_date in enumerate(dates) if is_date]
+    if not positions:
+        return rows
+    converted = []
+    for row in rows:
+        values = list(row)
+        for position in positions:
+            values[position] = to_date(values[position])
+        converted.append(tuple(values))
+    return converted
@@ -0,0 +1,145 @@
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from .counters import ThreadCounters
+
+T = TypeVar("T")
+
+# Primary result codes of errors caused by another connection's locks
+RETRYABLE_ERRORS = (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+@dataclass(frozen=True)
+class ContentionStats:
+    calls: int
+    retries: int
+    # Calls that still failed after the last allowed attempt
+    gave_up: int
+    # Seconds spent in attempts that failed on a lock, plus backoff sleeps
+    blocked_time: float
+
+
+class RetryPolicy:
+    """
+    How long to wait for locks held by other connections.
+
+    `busy_timeout` (in seconds) is SQLite's own wait: a statement blocked by
+    a lock keeps retrying inside SQLite for up to that long. Statements that
+    still fail with SQLITE_BUSY or SQLITE_LOCKED once the timeout passes,
+    such as BEGIN and COMMIT, are retried up to `max_attempts` times,
+    sleeping a random delay of up to `base_delay * 2 ** retry` seconds
+    (capped at `max_delay`) in between, as long as the total time blocked
+    stays within `max_total_wait`.
+
+    SQLITE_BUSY_SNAPSHOT is not retried: a deferred transaction that read an
+    older snapshot than the last commit can never upgrade to a write, so the
+    whole transaction has to be restarted instead. Statements run through
+    record(), such as those of repositories, which run inside an open
+    transaction, are never retried either; their lock errors are only
+    counted.
+
+    One policy can be shared by several pools; its stats() then cover them
+    all.
+    """
+
+    def __init__(
+        self,
+        busy_timeout: float = 5.0,
+        max_attempts: int = 8,
+        base_delay: float = 0.005,
+        max_delay: float = 0.25,
+        max_total_wait: float = 10.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be positive, got {max_attempts}")
+        self.busy_timeout = busy_timeout
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_wait = max_total_wait
+
+        # Updated on every statement, so kept per thread rather than locked
+        self._counters = ThreadCounters("calls", "retries", "gave_up", "blocked_time")
+
+    def call(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Call `fn(*args)`, retrying it while it fails on another connection's
+        lock, and re-raise the last error once the policy's limits are hit
+        """
+        blocked = 0.0
+        attempt = 1
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    return fn(*args)
+                except sqlite3.OperationalError as e:
+                    if not self.locked(e):
+                        raise
+                    blocked += time.perf_counter() - started
+                    delay = self.backoff(attempt)
+                    if (
+                        not self.retryable(e)
+                        or attempt >= self.max_attempts
+                        or blocked + delay > self.max_total_wait
+                    ):
+                        self._counters.add("gave_up")
+                        raise
+
+                time.sleep(delay)
+                blocked += delay
+                attempt += 1
+        finally:
+            self._counters.add("calls")
+            if blocked:
+                self._counters.add("retries", attempt - 1)
+                self._counters.add("blocked_time", blocked)
+
+    def record(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Call `fn(*args)` once, counting the call and, if it fails on another
+        connection's lock, the time it was blocked and a give-up. For
+        statements of an open transaction, which cannot be retried alone.
+        """
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        except sqlite3.OperationalError as e:
+            if self.locked(e):
+                self._counters.add("gave_up")
+                self._counters.add("blocked_time", time.perf_counter() - started)
+            raise
+        finally:
+            self._counters.add("calls")
+
+    def locked(self, error: sqlite3.OperationalError) -> bool:
+        """
+        Whether `error` was caused by another connection's lock
+        """
+        return error.sqlite_errorcode & 0xFF in RETRYABLE_ERRORS
+
+    def retryable(self, error: sqlite3.OperationalError) -> bool:
+        """
+        Whether `error` is a lock conflict that may clear on a later attempt
+        """
+        if error.sqlite_errorcode == sqlite3.SQLITE_BUSY_SNAPSHOT:
+            return False
+        return self.locked(error)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Jittered delay before retry number `attempt`
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def stats(self) -> ContentionStats:
+        totals = self._counters.totals()
+        return ContentionStats(
+            calls=totals["calls"],
+            retries=totals["retries"],
+            gave_up=totals["gave_up"],
+            blocked_time=float(totals["blocked_time"]),
+        )
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Index:
+    """
+    A secondary index declared on a SQLiteRepository's INDEXES.
+
+    `columns` may hold plain column names or SQL expressions (for expression
+    indexes), and `where` turns the index into a partial index.
+    """
+
+    name: str
+    columns: tuple[str, ...]
+    where: str | None = None
+    unique: bool = False
+
+    def create_sql(self, table: str) -> str:
+        unique = "UNIQUE " if self.unique else ""
+        sql = (
+            f"CREATE {unique}INDEX IF NOT EXISTS {self.name} "
+            f"ON {table} ({', '.join(self.columns)})"
+        )
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
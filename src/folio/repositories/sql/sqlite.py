@@ -1,10 +1,32 @@
+import json
 import sqlite3
-from abc import abstractmethod
-from typing import Optional, List, Any
+from contextlib import contextmanager
+from itertools import groupby, islice
+from typing import Optional, List, Any, Callable, Iterable, Iterator
 
 from ..base import Repository
+from .pagination import Page, encode_cursor, decode_cursor
+from .query import Query
+from .schema import Index
+from .dates import DateEncoding, to_date, encode_date
+from .statements import StatementCache, StatementCacheStats
+from .retry import RetryPolicy
 from folio.models import R
-from folio.common import normalize_date
+from folio.common import DuplicateRecordError, UnitOfWorkClosedError
+
+# Number of records sent to SQLite per executemany() call in add_many()
+DEFAULT_CHUNK_SIZE = 500
+
+# Number of rows pulled per fetchmany() call by the iter_* generators
+DEFAULT_FETCH_SIZE = 500
+
+DEFAULT_PAGE_SIZE = 50
+
+ON_CONFLICT = {
+    "fail": "INSERT",
+    "skip": "INSERT OR IGNORE",
+    "replace": "INSERT OR REPLACE",
+}
 
 
 class SQLiteRepository(Repository[R]):
@@ -13,7 +35,55 @@ class SQLiteRepository(Repository[R]):
     VALID_FIELDS: tuple[str, ...]
     RECORD_TYPE: type[R]
 
-    def __init__(self, connection: sqlite3.Connection):
+    # Columns of the table's UNIQUE constraint, the default upsert() target
+    UNIQUE_FIELDS: tuple[str, ...] = ()
+
+    # NOT NULL columns that page() may order by, besides id
+    SORTABLE_FIELDS: tuple[str, ...] = ()
+
+    # Secondary indexes, created by the schema migrations
+    INDEXES: tuple[Index, ...] = ()
+
+    # Columns holding dates, stored according to the DateEncoding
+    DATE_FIELDS: tuple[str, ...] = ()
+
+    # Conversions from stored column values to record attribute values,
+    # applied to non-NULL values when hydrating rows in _map_row()
+    CONVERTERS: dict[str, Callable[[Any], Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "VALID_FIELDS"):
+            converters = {field: to_date for field in cls.DATE_FIELDS}
+            converters.update(cls.CONVERTERS)
+            cls._converters = tuple(
+                (position, converters[field])
+                for position, field in enumerate(cls.VALID_FIELDS)
+                if field in converters
+            )
+            cls._date_positions = tuple(
+                cls.VALID_FIELDS.index(field) for field in cls.DATE_FIELDS
+            )
+            # SQL depends only on the class, so it is compiled once per class:
+            # fixed statements here, filter-dependent ones in _statements
+            cls._statements = StatementCache()
+            cls._columns = ", ".join(cls.VALID_FIELDS)
+            cls._placeholders = ", ".join(["?"] * len(cls.VALID_FIELDS))
+            if hasattr(cls, "RECORD_TYPE"):
+                table = cls.RECORD_TYPE.__name__.lower()
+                cls._table = table
+                cls._insert_sql = (
+                    f"INSERT INTO {table} ({cls._columns}) VALUES ({cls._placeholders})"
+                )
+                cls._get_sql = f"SELECT {cls._columns} FROM {table} WHERE id = ?"
+                cls._list_sql = f"SELECT {cls._columns} FROM {table}"
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        date_encoding: DateEncoding = DateEncoding.ISO,
+        retry: Optional[RetryPolicy] = None,
+    ):
         if not hasattr(self, "RECORD_TYPE"):
             raise NotImplementedError(
                 f"{self.__class__.__name__} must define RECORD_TYPE"
@@ -25,130 +95,557 @@ class SQLiteRepository(Repository[R]):
             )
 
         self.conn = connection
-        self.conn.row_factory = sqlite3.Row
-        self._ensure_table()
+        self.conn.row_factory = None
+        self.date_encoding = date_encoding
+        # Counts statements, and lock errors, for its contention stats
+        self.retry = retry
+        self._closed = False
 
     @property
     def _table_name(self) -> str:
-        return self.RECORD_TYPE.__name__.lower()
+        return self._table
 
     @property
     def columns(self) -> str:
-        return ", ".join(self.VALID_FIELDS)
+        return self._columns
 
     @property
     def placeholders(self) -> str:
-        return ", ".join(["?"] * (len(self.VALID_FIELDS)))
-
-    @abstractmethod
-    def _ensure_table(self) -> None: ...
-
-    @abstractmethod
-    def _map_row(self) -> R: ...
+        return self._placeholders
+
+    @classmethod
+    def statement_cache_stats(cls) -> StatementCacheStats:
+        """
+        Hits and misses of the compiled statements shared by all instances
+        """
+        return cls._statements.stats()
+
+    def _map_row(self, row: tuple) -> R:
+        """
+        Hydrate a record from a row of VALID_FIELDS values.
+
+        Rows read from the table already passed the record's validation when
+        they were written, so the record is built directly, without running
+        the dataclass __init__ and __post_init__ checks.
+        """
+        values = list(row)
+        for position, convert in self._converters:
+            if values[position] is not None:
+                values[position] = convert(values[position])
+
+        record = self.RECORD_TYPE.__new__(self.RECORD_TYPE)
+        record.__dict__.update(zip(self.VALID_FIELDS, values))
+        return record
 
     def add(self, record: R) -> int:
-        values = [getattr(record, field) for field in self.VALID_FIELDS]
-        sql = f"INSERT INTO {self._table_name} ({self.columns}) VALUES ({self.placeholders})"
-        cursor = self.conn.execute(sql, values)
+        with self._unique_violations():
+            cursor = self._execute(self._insert_sql, self._record_values(record))
         return cursor.lastrowid
 
+    def upsert(self, record: R, conflict_fields: tuple[str, ...] | None = None) -> int:
+        """
+        Insert `record`, or update the row it collides with on
+        `conflict_fields` (UNIQUE_FIELDS by default), in a single statement.
+        Return the ID of the inserted or updated row.
+        """
+        conflict_fields = tuple(conflict_fields or self.UNIQUE_FIELDS)
+        sql = self._statements.get(
+            ("upsert", conflict_fields), self._compile_upsert, conflict_fields
+        )
+        with self._unique_violations():
+            return self._execute(sql, self._record_values(record)).fetchone()[0]
+
+    def add_many(
+        self,
+        records: Iterable[R],
+        on_conflict: str = "fail",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[int]:
+        """
+        Insert records in chunks of `chunk_size` using executemany() and return
+        the IDs assigned to the inserted rows, in insertion order.
+
+        `on_conflict` decides what happens when a record violates a UNIQUE
+        constraint: "fail" raises DuplicateRecordError, "skip" leaves the
+        existing row untouched (the skipped record gets no ID) and "replace"
+        deletes the existing row and inserts the new one under a new ID.
+
+        All chunks run on the repository's connection, so they share the
+        transaction of the unit of work that owns it.
+        """
+        if on_conflict not in ON_CONFLICT:
+            raise ValueError(
+                f"on_conflict must be one of {', '.join(ON_CONFLICT)}, got {on_conflict!r}"
+            )
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        sql = self._insert_sql.replace("INSERT", ON_CONFLICT[on_conflict], 1)
+
+        ids = []
+        records = iter(records)
+        while chunk := list(islice(records, chunk_size)):
+            # Tables use AUTOINCREMENT, so rows inserted by this chunk are
+            # exactly those with an ID above the current maximum
+            last_id = self._execute(
+                f"SELECT COALESCE(MAX(id), 0) FROM {self._table_name}"
+            ).fetchone()[0]
+            with self._unique_violations():
+                self._executemany(sql, (self._record_values(r) for r in chunk))
+            rows = self._execute(
+                f"SELECT id FROM {self._table_name} WHERE id > ? ORDER BY id",
+                (last_id,),
+            ).fetchall()
+            ids.extend(row[0] for row in rows)
+        return ids
+
     def get(self, id_: int) -> Optional[R]:
-        sql = f"SELECT {self.columns} FROM {self._table_name} WHERE id = ?"
-        row = self.conn.execute(sql, (id_,)).fetchone()
+        row = self._execute(self._get_sql, (id_,)).fetchone()
         return self._map_row(row) if row else None
 
     def find(self, **fields) -> List[R]:
-        conditions = []
-        params = []
-
-        for field, value in self._filter_fields(fields).items():
-            normalized_value = self._normalize_value(field, value)
-            if normalized_value is not None:
-                conditions.append(f"{field} = ?")
-                params.append(normalized_value)
-
-        sql = f"SELECT {self.columns} FROM {self._table_name}"
-        if conditions:
-            sql += " WHERE " + " AND ".join(conditions)
-
-        rows = self.conn.execute(sql, params).fetchall()
+        sql, params = self._select_where(fields)
+        rows = self._execute(sql, params).fetchall()
         return [self._map_row(row) for row in rows]
 
     def list(self) -> List[R]:
-        sql = f"SELECT {self.columns} FROM {self._table_name}"
-        rows = self.conn.execute(sql).fetchall()
+        rows = self._execute(self._list_sql).fetchall()
         return [self._map_row(row) for row in rows]
 
+    def iter_find(self, chunk_size: int = DEFAULT_FETCH_SIZE, **fields) -> Iterator[R]:
+        """
+        Lazily yield the records matching `fields`, fetching `chunk_size` rows
+        at a time. Only valid while the owning unit of work is open.
+        """
+        sql, params = self._select_where(fields)
+        return self._iter_rows(sql, params, chunk_size)
+
+    def iter_list(self, chunk_size: int = DEFAULT_FETCH_SIZE) -> Iterator[R]:
+        """
+        Lazily yield all records, fetching `chunk_size` rows at a time.
+        Only valid while the owning unit of work is open.
+        """
+        return self._iter_rows(self._list_sql, [], chunk_size)
+
+    def query(self) -> Query[R]:
+        """
+        Start a lazy query over this repository's table; see Query.
+        """
+        return Query(self)
+
+    def count(self, **fields) -> int:
+        """
+        Count the records matching `fields`, compared as in find()
+        """
+        return self.query().where(**self._filter_fields(fields)).count()
+
+    def exists(self, **fields) -> bool:
+        """
+        Return whether any record matches `fields`, compared as in find()
+        """
+        return self.query().where(**self._filter_fields(fields)).exists()
+
+    def aggregate(
+        self,
+        group_by: str | tuple[str, ...] = (),
+        metrics: dict[str, str | tuple[str, str]] | None = None,
+        **fields,
+    ) -> List[tuple]:
+        """
+        Group the records matching `fields` and compute `metrics` in SQLite;
+        see Query.aggregate.
+        """
+        query = self.query().where(**self._filter_fields(fields))
+        return query.aggregate(group_by=group_by, metrics=metrics)
+
+    def values(self, *fields: str, distinct: bool = False) -> List[tuple]:
+        """
+        Return `fields` of every row as named tuples; see Query.values.
+        """
+        return self.query().values(*fields, distinct=distinct)
+
+    def values_list(
+        self, *fields: str, flat: bool = False, distinct: bool = False
+    ) -> List[Any]:
+        """
+        Return `fields` of every row as tuples; see Query.values_list.
+        """
+        return self.query().values_list(*fields, flat=flat, distinct=distinct)
+
+    def page(
+        self,
+        after: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: str = "id",
+    ) -> Page[R]:
+        """
+        Return up to `limit` records ordered by `order_by` ("id" or one of
+        SORTABLE_FIELDS, prefixed with "-" for descending order), starting
+        after the position encoded in the `after` cursor.
+
+        Pages are selected with a keyset predicate on (order_by, id) rather
+        than OFFSET, so every page costs the same regardless of its depth.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        descending = order_by.startswith("-")
+        field = order_by.removeprefix("-")
+        if field != "id" and field not in self.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot order {self._table_name} by {field}")
+
+        sql = self._statements.get(
+            ("page", order_by, after is not None),
+            self._compile_page,
+            field,
+            descending,
+            after is not None,
+        )
+        params = []
+        if after is not None:
+            key = decode_cursor(after, order_by)
+            if not isinstance(key, list) or len(key) != (1 if field == "id" else 2):
+                raise ValueError(f"Invalid page cursor: {after!r}")
+            params.extend(key)
+        params.append(limit + 1)
+
+        rows = self._execute(sql, params).fetchall()
+        records = [self._map_row(row) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            if field == "id":
+                key = [last[-1]]
+            else:
+                key = [self._encode(field, last[self._position(field)]), last[-1]]
+            next_cursor = encode_cursor(order_by, key)
+        return Page(records, next_cursor)
+
+    def close(self) -> None:
+        """
+        Mark the repository as closed; called when its unit of work ends.
+        """
+        self._closed = True
+
     def update(
         self,
         key: int | None = None,
         *,
         filters: dict[str, Any] | None = None,
+        returning: bool = False,
         **fields: dict[str, Any],
-    ) -> int:
+    ) -> int | List[R]:
+        """
+        Update the record with ID `key`, or every record matching `filters`,
+        in a single UPDATE statement. Return the number of updated rows, or
+        the updated records themselves when `returning` is set.
+        """
         if not fields:
             raise ValueError("No fields provided")
 
-        valid_updates = self._filter_fields(fields)
+        valid_updates = {
+            field: self._normalize_value(field, value)
+            for field, value in self._filter_fields(fields).items()
+        }
         if not valid_updates:
             raise ValueError(f"No valid fields passed with {fields}")
 
-        set_clause = ", ".join(f"{field} = ?" for field in valid_updates)
+        if key is not None:
+            where = None
+        elif not filters:
+            raise ValueError("Must provide either key or filters")
+        else:
+            # NULL filters compile to IS NULL, so nullness is part of the shape
+            where = frozenset(
+                (field, value is None) for field, value in filters.items()
+            )
 
+        sql, set_order, where_order = self._statements.get(
+            ("update", frozenset(valid_updates), where, returning),
+            self._compile_update,
+            valid_updates,
+            where,
+            returning,
+        )
+        params = [valid_updates[field] for field in set_order]
         if key is not None:
-            if not self.get(key):
-                raise ValueError(f"Record with ID {key} not found")
-            values = list(valid_updates.values()) + [key]
-            sql = f"UPDATE {self._table_name} SET {set_clause} WHERE id = ?"
-            cursor = self.conn.execute(sql, values)
-            return cursor.rowcount
+            params.append(key)
+        else:
+            params.extend(
+                self._normalize_value(field, filters[field]) for field in where_order
+            )
 
-        if not filters:
-            raise ValueError("Must provide either key or filters")
+        with self._unique_violations():
+            cursor = self._execute(sql, params)
+            records = [self._map_row(row) for row in cursor] if returning else None
 
-        where_clause = []
-        where_values = []
-        for field, value in filters.items():
-            if field not in self.VALID_FIELDS:
-                raise ValueError(f"Invalid field: {field}")
-            if value is None:
-                where_clause.append(f"{field} IS NULL")
-            else:
-                where_clause.append(f"{field} = ?")
-                where_values.append(value)
+        if key is not None and cursor.rowcount == 0:
+            raise ValueError(f"Record with ID {key} not found")
+        return records if returning else cursor.rowcount
 
-        sql = f"UPDATE {self._table_name} SET {set_clause} WHERE {' AND '.join(where_clause)}"
-        cursor = self.conn.execute(sql, list(valid_updates.values()) + where_values)
-        return cursor.rowcount
+    def update_many(self, changes: Iterable[tuple[int, dict[str, Any]]]) -> int:
+        """
+        Apply `(id, fields)` updates in order and return the number of updated
+        rows. Consecutive updates touching the same fields share one
+        executemany() call, so homogeneous bulk edits run as a single batch.
+        """
 
-    def delete(self, key: int | None = None, **fields: dict[str, Any]) -> int:
+        def signature(change: tuple[int, dict[str, Any]]) -> tuple[str, ...]:
+            return tuple(self._filter_fields(change[1]))
+
+        updated = 0
+        for fields, group in groupby(changes, key=signature):
+            if not fields:
+                raise ValueError("Each update must include at least one valid field")
+
+            sql = self._statements.get(
+                ("update_many", fields), self._compile_update_many, fields
+            )
+            params = (
+                [self._normalize_value(field, change[field]) for field in fields]
+                + [key]
+                for key, change in group
+            )
+            with self._unique_violations():
+                updated += self._executemany(sql, params).rowcount
+        return updated
+
+    def delete(
+        self,
+        key: int | None = None,
+        *,
+        returning: bool = False,
+        **fields: dict[str, Any],
+    ) -> int | List[R]:
+        """
+        Delete the record with ID `key`, or every record matching `fields`.
+        Return the number of deleted rows, or the deleted records themselves
+        when `returning` is set.
+        """
         if key is not None:
-            sql = f"DELETE FROM {self._table_name} WHERE id = ?"
-            cursor = self.conn.execute(sql, (key,))
-            return cursor.rowcount
+            sql, _ = self._statements.get(
+                ("delete", None, returning), self._compile_delete, None, returning
+            )
+            return self._delete(sql, [key], returning)
 
-        where_clause = []
-        values = []
+        fields = self._filter_fields(fields)
+        if not fields:
+            raise ValueError("delete() requires either a key or at least one filter")
+
+        sql, order = self._statements.get(
+            ("delete", frozenset(fields), returning),
+            self._compile_delete,
+            frozenset(fields),
+            returning,
+        )
+        values = [self._normalize_value(field, fields[field]) for field in order]
+        return self._delete(sql, values, returning)
+
+    def delete_many(self, ids: Iterable[int], returning: bool = False) -> int | List[R]:
+        """
+        Delete the records with the given IDs in one statement. Return the
+        number of deleted rows, or the deleted records when `returning` is set.
+        """
+        # The IDs are bound as a single JSON array, so every call shares one
+        # statement whatever the number of IDs, and SQLite's bound-variable
+        # limit does not apply
+        sql = self._statements.get(
+            ("delete_many", returning), self._compile_delete_many, returning
+        )
+        return self._delete(sql, [json.dumps([int(id_) for id_ in ids])], returning)
+
+    def _delete(self, sql: str, params: List[Any], returning: bool) -> int | List[R]:
+        cursor = self._execute(sql, params)
+        if not returning:
+            return cursor.rowcount
+        return [self._map_row(row) for row in cursor]
+
+    def _select_where(self, fields: dict[str, Any]) -> tuple[str, List[Any]]:
+        fields = self._filter_fields(fields)
+        signature = frozenset(fields)
+        sql, order = self._statements.get(
+            ("select", signature), self._compile_select, signature
+        )
+        return sql, [self._normalize_value(field, fields[field]) for field in order]
+
+    # Statement compilers, run once per signature through self._statements.
+    # Each returns the SQL text and, for filtered statements, the order in
+    # which the filter values must be bound
+
+    def _compile_select(self, fields: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+        order = tuple(field for field in self.VALID_FIELDS if field in fields)
+        sql = self._list_sql
+        if order:
+            sql += " WHERE " + " AND ".join(f"{field} = ?" for field in order)
+        return sql, order
+
+    def _compile_upsert(self, conflict_fields: tuple[str, ...]) -> str:
+        if not conflict_fields:
+            raise ValueError(f"{self.__class__.__name__} has no conflict fields")
+        for field in conflict_fields:
+            if field not in self.VALID_FIELDS:
+                raise ValueError(f"Invalid field: {field}")
 
-        for field, value in self._filter_fields(fields).items():
-            if value is not None:
+        # Fall back to a no-op update when every column is part of the
+        # conflict target, as DO NOTHING would not return the existing ID
+        updates = [f for f in self.VALID_FIELDS if f not in conflict_fields]
+        set_clause = ", ".join(
+            f"{f} = excluded.{f}" for f in updates or conflict_fields[:1]
+        )
+        # UNIQUE constraints treat NULLs as distinct, so rows with a NULL in
+        # the target never conflict on it; they conflict on the unique
+        # partial indexes covering them instead, such as one WHERE end IS NULL
+        targets = [f"({', '.join(conflict_fields)})"] + [
+            f"({', '.join(index.columns)}) WHERE {index.where}"
+            for index in self.INDEXES
+            if index.unique
+            and index.where
+            and set(index.columns) <= set(conflict_fields)
+        ]
+        conflicts = " ".join(
+            f"ON CONFLICT {target} DO UPDATE SET {set_clause}" for target in targets
+        )
+        return f"{self._insert_sql} {conflicts} RETURNING id"
+
+    def _compile_update(
+        self,
+        fields: dict[str, Any],
+        where: frozenset[tuple[str, bool]] | None,
+        returning: bool,
+    ) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+        set_order = tuple(fields)
+        set_clause = ", ".join(f"{field} = ?" for field in set_order)
+
+        if where is None:
+            where_clause = ["id = ?"]
+            where_order = ()
+        else:
+            is_null = dict(where)
+            for field in is_null:
                 if field not in self.VALID_FIELDS:
-                    raise ValueError(f"Invalid field:{field}")
-                where_clause.append(f"{field} = ?")
-                values.append(value)
+                    raise ValueError(f"Invalid field: {field}")
+            columns = [field for field in self.VALID_FIELDS if field in is_null]
+            where_clause = [
+                f"{field} IS NULL" if is_null[field] else f"{field} = ?"
+                for field in columns
+            ]
+            where_order = tuple(field for field in columns if not is_null[field])
 
-        if not where_clause:
-            raise ValueError("delete() requires either a ky or at least one filter")
+        sql = f"UPDATE {self._table_name} SET {set_clause} WHERE {' AND '.join(where_clause)}"
+        if returning:
+            sql += f" RETURNING {self.columns}"
+        return sql, set_order, where_order
+
+    def _compile_update_many(self, fields: tuple[str, ...]) -> str:
+        set_clause = ", ".join(f"{field} = ?" for field in fields)
+        return f"UPDATE {self._table_name} SET {set_clause} WHERE id = ?"
+
+    def _compile_delete(
+        self, fields: frozenset[str] | None, returning: bool
+    ) -> tuple[str, tuple[str, ...]]:
+        if fields is None:
+            where_clause = ["id = ?"]
+            order = ()
+        else:
+            order = tuple(field for field in self.VALID_FIELDS if field in fields)
+            where_clause = [f"{field} = ?" for field in order]
 
         sql = f"DELETE FROM {self._table_name} WHERE {' AND '.join(where_clause)}"
-        cursor = self.conn.execute(sql, values)
-        return cursor.rowcount
+        if returning:
+            sql += f" RETURNING {self.columns}"
+        return sql, order
+
+    def _compile_delete_many(self, returning: bool) -> str:
+        sql = (
+            f"DELETE FROM {self._table_name}"
+            " WHERE id IN (SELECT value FROM json_each(?))"
+        )
+        if returning:
+            sql += f" RETURNING {self.columns}"
+        return sql
+
+    def _compile_page(self, field: str, descending: bool, after: bool) -> str:
+        key_columns = ["id"] if field == "id" else [field, "id"]
+        direction = "DESC" if descending else "ASC"
+
+        sql = f"SELECT {self.columns}, id FROM {self._table_name}"
+        if after:
+            operator = "<" if descending else ">"
+            placeholders = ", ".join("?" * len(key_columns))
+            sql += f" WHERE ({', '.join(key_columns)}) {operator} ({placeholders})"
+
+        order = ", ".join(f"{column} {direction}" for column in key_columns)
+        return sql + f" ORDER BY {order} LIMIT ?"
+
+    def _iter_rows(
+        self, sql: str, params: List[Any], chunk_size: int = DEFAULT_FETCH_SIZE
+    ) -> Iterator[R]:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        cursor = self._execute(sql, params)
+        while True:
+            self._check_open()
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._map_row(row)
+
+    def _execute(self, sql: str, params: List[Any] = ()) -> sqlite3.Cursor:
+        self._check_open()
+        if self.retry is None:
+            return self.conn.execute(sql, params)
+        return self.retry.record(self.conn.execute, sql, params)
+
+    def _executemany(self, sql: str, params: Iterable[List[Any]]) -> sqlite3.Cursor:
+        self._check_open()
+        if self.retry is None:
+            return self.conn.executemany(sql, params)
+        return self.retry.record(self.conn.executemany, sql, params)
+
+    @contextmanager
+    def _unique_violations(self):
+        """
+        Translate UNIQUE constraint failures into DuplicateRecordError
+        """
+        try:
+            yield
+        except sqlite3.IntegrityError as e:
+            if e.sqlite_errorname != "SQLITE_CONSTRAINT_UNIQUE":
+                raise
+            raise DuplicateRecordError(
+                f"{self.RECORD_TYPE.__name__} already exists: {e}"
+            ) from e
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise UnitOfWorkClosedError(
+                f"{self.__class__.__name__} was used after its unit of work closed"
+            )
+
+    def _position(self, field: str) -> int:
+        return self.VALID_FIELDS.index(field)
+
+    def _record_values(self, record: R) -> List[Any]:
+        values = [getattr(record, field) for field in self.VALID_FIELDS]
+        if self.date_encoding is DateEncoding.ORDINAL:
+            for position in self._date_positions:
+                if values[position] is not None:
+                    values[position] = values[position].toordinal()
+        return values
+
+    def _encode(self, field: str, value: Any) -> Any:
+        if value is not None and field in self.DATE_FIELDS:
+            return encode_date(value, self.date_encoding)
+        return value
 
     def _normalize_value(self, field: str, value: Any) -> Any:
         if value is None:
             return None
-        if field in ("start", "end"):
-            return normalize_date(value)
+        if field in self.DATE_FIELDS:
+            return encode_date(value, self.date_encoding)
         if isinstance(value, str):
             return value.strip()
         return value
@@ -1,11 +1,8 @@
-import sqlite3
-import datetime as dt
-
 from typing import List
 
 from .sqlite import SQLiteRepository
+from .schema import Index
 from folio.models import Address
-from folio.common import normalize_date
 
 
 class SQLiteAddressRepository(SQLiteRepository[Address]):
@@ -19,37 +16,22 @@ class SQLiteAddressRepository(SQLiteRepository[Address]):
         "country",
         "postal_code",
     )
-
-    def __init__(self, connection: sqlite3.Connection):
-        super().__init__(connection)
-        self._ensure_table()
-
-    def _map_row(self, row) -> Address:
-        data = dict(row)
-        data["start"] = dt.date.fromisoformat(data["start"])
-        data["end"] = dt.date.fromisoformat(data["end"]) if data["end"] else None
-        return Address(**data)
-
-    def _ensure_table(self) -> None:
-        self.conn.execute(
-            """
-        CREATE TABLE IF NOT EXISTS address (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            start TEXT NOT NULL,
-            end TEXT,
-            street TEXT NOT NULL,
-            city TEXT NOT NULL,
-            province TEXT,
-            country TEXT NOT NULL,
-            postal_code TEXT NOT NULL,
-            CHECK(end is NULL OR end >= start),
-            UNIQUE(street, city, start, end)
-        )
-            """
-        )
+    UNIQUE_FIELDS = ("street", "city", "start", "end")
+    SORTABLE_FIELDS = ("start",)
+    INDEXES = (
+        Index("address_open", ("start",), where="end IS NULL"),
+        # UNIQUE treats NULLs as distinct, so open addresses need their own key
+        Index(
+            "address_open_unique",
+            ("street", "city", "start"),
+            where="end IS NULL",
+            unique=True,
+        ),
+    )
+    DATE_FIELDS = ("start", "end")
 
     def find_open(self) -> List[Address]:
         """Return all addresses with no end end"""
         sql = f"SELECT {self.columns} FROM {self._table_name} WHERE end IS NULL"
-        rows = self.conn.execute(sql).fetchall()
+        rows = self._execute(sql).fetchall()
         return [self._map_row(row) for row in rows]
@@ -0,0 +1,81 @@
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from .counters import ThreadCounters
+
+# Statements kept per repository class. Filter signatures are subsets of a
+# handful of fields, so the cache only fills up when callers combine many
+# different filters, orderings or upsert targets
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# Prepared statements kept by each sqlite3 connection (the default is 128),
+# sized so every cached SQL text can stay prepared on the connection too
+CONNECTION_STATEMENT_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class StatementCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class StatementCache:
+    """
+    SQL text compiled once per statement signature, such as
+    ("select", frozenset({"origin", "date"})), and reused on later calls.
+
+    Entries are whatever the builder returns, typically the SQL text plus the
+    order in which to bind parameters. Once `maxsize` signatures are cached,
+    the least recently used entry is evicted.
+
+    The cache is shared by every thread using the repository class. Lookups
+    take no lock: a hit only stamps its entry with a use counter, a single
+    store, and misses compile and evict under the lock, so each signature is
+    built once.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_STATEMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        # Each value is [entry, last use]
+        self._entries: dict[Hashable, list] = {}
+        self._uses = itertools.count()
+        self._lock = threading.Lock()
+        self._counters = ThreadCounters("hits", "misses")
+
+    def get(self, key: Hashable, build: Callable[..., Any], *args: Any) -> Any:
+        """
+        Return the entry cached under `key`, compiling it with build(*args)
+        on the first request
+        """
+        slot = self._entries.get(key)
+        if slot is not None:
+            slot[1] = next(self._uses)
+            self._counters.add("hits")
+            return slot[0]
+
+        with self._lock:
+            slot = self._entries.get(key)
+            if slot is None:
+                self._counters.add("misses")
+                slot = [build(*args), next(self._uses)]
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[
+                        min(self._entries, key=lambda k: self._entries[k][1])
+                    ]
+                self._entries[key] = slot
+            else:
+                slot[1] = next(self._uses)
+                self._counters.add("hits")
+        return slot[0]
+
+    def stats(self) -> StatementCacheStats:
+        totals = self._counters.totals()
+        return StatementCacheStats(totals["hits"], totals["misses"], len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.reset()
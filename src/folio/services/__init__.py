@@ -4,6 +4,12 @@ from .address_service import AddressService
 from .employment_service import EmploymentService
 from .travel_service import TravelService
 from .work_service import WorkService
+from .async_services import (
+    AsyncAddressService,
+    AsyncEmploymentService,
+    AsyncTravelService,
+    AsyncWorkService,
+)
 
 __all__ = {
     "AddressService",
@@ -11,4 +17,8 @@ __all__ = {
     "EmploymentService",
     "TravelService",
     "WorkService",
+    "AsyncAddressService",
+    "AsyncEmploymentService",
+    "AsyncTravelService",
+    "AsyncWorkService",
 }
@@ -2,13 +2,11 @@ import datetime as dt
 from typing import List, Optional
 from folio.models import Address
 from folio.uow import UnitOfWork
-from folio.common import normalize_date
+from .base import Service
+from folio.common import normalize_date, DuplicateRecordError
 
 
-class AddressService:
-    def __init__(self, uow: UnitOfWork):
-        self.uow = uow
-
+class AddressService(Service):
     def add(
         self,
         street: str,
@@ -58,15 +56,19 @@ class AddressService:
                         )
 
             self._overlaps(data["start"], data["end"], self.uow)
-            return self.uow.address.add(Address(**data))
+            try:
+                return self.uow.address.add(Address(**data))
+            except DuplicateRecordError as e:
+                fields = ", ".join(f"{v}" for _, v in data.items())
+                raise ValueError(f"Address already exists for {fields}") from e
 
     def get(self, address_id: int) -> Optional[Address]:
-        with self.uow:
-            return self.uow.address.get(address_id)
+        with self.uow.read_only() as uow:
+            return uow.address.get(address_id)
 
     def list(self) -> List[Address]:
-        with self.uow:
-            return self.uow.address.list()
+        with self.uow.read_only() as uow:
+            return uow.address.list()
 
     def find(
         self,
@@ -88,8 +90,8 @@ class AddressService:
             "province": province.strip() if province else None,
         }
 
-        with self.uow:
-            return self.uow.address.find(**data)
+        with self.uow.read_only() as uow:
+            return uow.address.find(**data)
 
     def update(self, match: dict, updates: dict) -> int:
         updates = {
@@ -146,18 +148,16 @@ class AddressService:
             "city": city,
             "country": country,
             "postal_code": postal_code,
-            "start": start,
-            "end": end,
+            "start": dt.date.fromisoformat(start) if isinstance(start, str) else start,
+            "end": dt.date.fromisoformat(end) if isinstance(end, str) else end,
             "province": province,
         }
 
-        addresses = self.find(**filters)
-        if not addresses:
-            raise ValueError("No records found.")
-
         with self.uow:
-            self.uow.address.delete(**filters)
-            return len(addresses)
+            deleted = self.uow.address.delete(**filters)
+            if not deleted:
+                raise ValueError("No records found.")
+            return deleted
 
     def _overlaps(self, start: dt.date, end: dt.date, uow: UnitOfWork) -> None:
         effective_end = end or dt.date.today()
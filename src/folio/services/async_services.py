@@ -0,0 +1,115 @@
+from typing import Any, List, Optional
+
+from folio.models import Address, Employment, Travel, Work
+from folio.uow import AsyncSQLiteUnitOfWork
+from .base import Service
+from .address_service import AddressService
+from .employment_service import EmploymentService
+from .travel_service import TravelService
+from .work_service import WorkService
+
+
+class AsyncService:
+    """
+    Awaitable counterpart of a Service. Each call runs the synchronous service
+    method off the event loop: writes on the unit of work's writer thread,
+    reads on its reader threads.
+    """
+
+    service_class: type[Service]
+
+    def __init__(self, uow: AsyncSQLiteUnitOfWork):
+        self.uow = uow
+
+    def batch(self) -> AsyncSQLiteUnitOfWork:
+        """
+        Return a scope running every call made inside it in one transaction:
+
+            async with service.batch():
+                for row in rows:
+                    await service.add(**row)
+        """
+        return self.uow
+
+    async def _write(self, method: str, *args, **kwargs) -> Any:
+        return await self.uow.run(
+            lambda uow: getattr(self.service_class(uow), method)(*args, **kwargs)
+        )
+
+    async def _read(self, method: str, *args, **kwargs) -> Any:
+        return await self.uow.read(
+            lambda uow: getattr(self.service_class(uow), method)(*args, **kwargs)
+        )
+
+
+class AsyncTravelService(AsyncService):
+    service_class = TravelService
+
+    async def add(self, *args, **kwargs) -> int:
+        return await self._write("add", *args, **kwargs)
+
+    async def get(self, travel_id: int) -> Optional[Travel]:
+        return await self._read("get", travel_id)
+
+    async def list(self) -> List[Travel]:
+        return await self._read("list")
+
+    async def find(self, **kwargs) -> List[Travel]:
+        return await self._read("find", **kwargs)
+
+
+class AsyncEmploymentService(AsyncService):
+    service_class = EmploymentService
+
+    async def add(self, *args, **kwargs) -> int:
+        return await self._write("add", *args, **kwargs)
+
+    async def get(self, employment_id: int) -> Optional[Employment]:
+        return await self._read("get", employment_id)
+
+    async def list(self) -> List[Employment]:
+        return await self._read("list")
+
+    async def find(self, **kwargs) -> List[Employment]:
+        return await self._read("find", **kwargs)
+
+
+class AsyncAddressService(AsyncService):
+    service_class = AddressService
+
+    async def add(self, *args, **kwargs) -> int:
+        return await self._write("add", *args, **kwargs)
+
+    async def get(self, address_id: int) -> Optional[Address]:
+        return await self._read("get", address_id)
+
+    async def list(self) -> List[Address]:
+        return await self._read("list")
+
+    async def find(self, **kwargs) -> List[Address]:
+        return await self._read("find", **kwargs)
+
+    async def update(self, match: dict, updates: dict) -> int:
+        return await self._write("update", match, updates)
+
+    async def delete(self, *args, **kwargs) -> int:
+        return await self._write("delete", *args, **kwargs)
+
+
+class AsyncWorkService(AsyncService):
+    service_class = WorkService
+
+    async def add(self, *args, **kwargs) -> int:
+        return await self._write("add", *args, **kwargs)
+
+    async def get(self, work_id: int) -> Optional[Work]:
+        return await self._read("get", work_id)
+
+    async def list(self) -> List[Work]:
+        return await self._read("list")
+
+    async def find(self, **kwargs) -> List[Work]:
+        return await self._read("find", **kwargs)
+
+    async def update(self, key: int, **kwargs) -> int:
+        return await self._write("update", key, **kwargs)
@@ -0,0 +1,29 @@
+from typing import Callable
+
+from folio.uow import UnitOfWork, ScopedUnitOfWork
+
+
+class Service:
+    def __init__(self, uow: UnitOfWork | Callable[[], UnitOfWork]):
+        """
+        `uow` is a unit of work, or a factory of them. With a factory (or a
+        ScopedUnitOfWork) every concurrent thread or task calling the service
+        gets a unit of work of its own, so one instance can serve them all.
+        """
+        if not isinstance(uow, UnitOfWork):
+            uow = ScopedUnitOfWork(uow)
+        self.uow = uow
+
+    def batch(self) -> UnitOfWork:
+        """
+        Return a scope that runs every service call made inside it in one
+        transaction, committed once when the scope ends:
+
+            with service.batch():
+                for row in rows:
+                    service.add(**row)
+
+        Each call still runs in its own nested scope, so a call that fails
+        is undone on its own and the batch carries on if the error is caught.
+        """
+        return self.uow
@@ -1,13 +1,11 @@
 import datetime as dt
 from typing import List, Optional
 from folio.models import Employment
-from folio.uow import UnitOfWork
+from .base import Service
+from folio.common import DuplicateRecordError
 
 
-class EmploymentService:
-    def __init__(self, uow: UnitOfWork):
-        self.uow = uow
-
+class EmploymentService(Service):
     def add(
         self,
         company: str,
@@ -21,9 +19,6 @@ class EmploymentService:
         start = dt.date.fromisoformat(start) if isinstance(start, str) else start
         end = dt.date.fromisoformat(end) if isinstance(end, str) else end
 
-        if self.find(company=company, start=start):
-            raise ValueError(f"Employment already exists for {company, start}")
-
         employment = Employment(
             start=start,
             end=end,
@@ -34,16 +29,20 @@ class EmploymentService:
         )
 
         with self.uow:
-            new_id = self.uow.employment.add(employment)
-            return new_id
+            try:
+                return self.uow.employment.add(employment)
+            except DuplicateRecordError as e:
+                raise ValueError(
+                    f"Employment already exists for {company, start}"
+                ) from e
 
     def get(self, employment_id: int) -> Optional[Employment]:
-        with self.uow:
-            return self.uow.employment.get(employment_id)
+        with self.uow.read_only() as uow:
+            return uow.employment.get(employment_id)
 
     def list(self) -> List[Employment]:
-        with self.uow:
-            return self.uow.employment.list()
+        with self.uow.read_only() as uow:
+            return uow.employment.list()
 
     def find(
         self,
@@ -63,5 +62,5 @@ class EmploymentService:
             "phone": phone.strip() if phone else None,
         }
 
-        with self.uow:
-            return self.uow.employment.find(**data)
+        with self.uow.read_only() as uow:
+            return uow.employment.find(**data)
@@ -2,37 +2,36 @@ import datetime as dt
 import re
 from typing import List, Optional
 from folio.models import Travel
-from folio.uow import UnitOfWork
+from .base import Service
+from folio.common import DuplicateRecordError
 
 COUNTRY_CODE_RE = re.compile(r"^[A-Z]{3}$")
 
 
-class TravelService:
-    def __init__(self, uow: UnitOfWork):
-        self.uow = uow
-
+class TravelService(Service):
     def add(self, origin: str, destination: str, date: dt.date, notes: str = "") -> int:
         date = dt.date.fromisoformat(date) if isinstance(date, str) else date
 
         origin, destination = origin.upper(), destination.upper()
         self._validate_country_codes(origin, destination)
 
-        if self.find(origin, destination, date):
-            raise ValueError(f"Travel already exists for {origin, destination, date}")
-
         travel = Travel(origin=origin, destination=destination, date=date, notes=notes)
 
         with self.uow:
-            new_id = self.uow.travel.add(travel)
-            return new_id
+            try:
+                return self.uow.travel.add(travel)
+            except DuplicateRecordError as e:
+                raise ValueError(
+                    f"Travel already exists for {origin, destination, date}"
+                ) from e
 
     def get(self, travel_id) -> Optional[Travel]:
-        with self.uow:
-            return self.uow.travel.get(travel_id)
+        with self.uow.read_only() as uow:
+            return uow.travel.get(travel_id)
 
     def list(self) -> List[Travel]:
-        with self.uow:
-            return self.uow.travel.list()
+        with self.uow.read_only() as uow:
+            return uow.travel.list()
 
     def find(self, origin=None, destination=None, date=None) -> List[Travel]:
         data = {
@@ -40,8 +39,8 @@ class TravelService:
             "destination": destination.strip() if destination else None,
             "date": dt.date.fromisoformat(date) if isinstance(date, str) else date,
         }
-        with self.uow:
-            return self.uow.travel.find(**data)
+        with self.uow.read_only() as uow:
+            return uow.travel.find(**data)
 
     def _validate_country_codes(self, origin: str, destination: str) -> None:
         if not COUNTRY_CODE_RE.match(origin):
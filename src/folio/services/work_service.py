@@ -1,13 +1,11 @@
 from typing import List, Optional
 
 from folio.models import Work
-from folio.uow import UnitOfWork
+from .base import Service
+from folio.common import DuplicateRecordError
 
 
-class WorkService:
-    def __init__(self, uow: UnitOfWork):
-        self.uow = uow
-
+class WorkService(Service):
     def add(
         self,
         author: str,
@@ -17,22 +15,28 @@ class WorkService:
         is_read: bool = True,
     ) -> int:
 
-        if self.find(author=author, title=title, year=year):
-            raise ValueError(f"Work already exists for {author, title, year}")
-
         work = Work(author=author, title=title, year=year, genre=genre, is_read=is_read)
 
         with self.uow:
-            new_id = self.uow.work.add(work)
-            return new_id
+            # The UNIQUE constraint treats NULL years as distinct, but a work
+            # without a year still duplicates any work with the same title
+            if self.uow.work.exists(author=author, title=title, year=year):
+                raise ValueError(f"Work already exists for {author, title, year}")
+
+            try:
+                return self.uow.work.add(work)
+            except DuplicateRecordError as e:
+                raise ValueError(
+                    f"Work already exists for {author, title, year}"
+                ) from e
 
     def get(self, work_id: int) -> Optional[Work]:
-        with self.uow:
-            return self.uow.work.get(work_id)
+        with self.uow.read_only() as uow:
+            return uow.work.get(work_id)
 
     def list(self) -> List[Work]:
-        with self.uow:
-            return self.uow.work.list()
+        with self.uow.read_only() as uow:
+            return uow.work.list()
 
     def find(
         self,
@@ -50,8 +54,8 @@ class WorkService:
             "is_read": is_read if is_read is not None else None,
         }
 
-        with self.uow:
-            return self.uow.work.find(**data)
+        with self.uow.read_only() as uow:
+            return uow.work.find(**data)
 
     def update(
         self,
@@ -1,15 +1,33 @@
 from .unit_of_work import UnitOfWork
+from .scoped import ScopedUnitOfWork
+from folio.repositories import RetryPolicy, ContentionStats
 from .sqlite.sqlite_uow import (
+    SQLiteUnitOfWork,
     TravelSQLiteUoW,
     EmploymentSQLiteUoW,
     AddressSQLiteUoW,
     WorkSQLiteUoW,
 )
+from .sqlite.pool import ConnectionPool, PoolStats
+from .sqlite.profiles import Profile, PROFILES
+from .sqlite.coordinator import WriteCoordinator, WriteStats
+from .sqlite.async_uow import AsyncSQLiteUnitOfWork
 
 __all__ = [
     "UnitOfWork",
+    "ScopedUnitOfWork",
+    "SQLiteUnitOfWork",
+    "AsyncSQLiteUnitOfWork",
+    "WriteCoordinator",
+    "WriteStats",
+    "RetryPolicy",
+    "ContentionStats",
     "TravelSQLiteUoW",
     "EmploymentSQLiteUoW",
     "AddressSQLiteUoW",
     "WorkSQLiteUoW",
+    "ConnectionPool",
+    "PoolStats",
+    "Profile",
+    "PROFILES",
 ]
@@ -0,0 +1,109 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from folio.common import UnitOfWorkClosedError
+from .unit_of_work import UnitOfWork
+
+
+class ScopedUnitOfWork(UnitOfWork):
+    """
+    A unit of work that can be shared by concurrent threads and asyncio tasks.
+
+    A unit of work holds the connection and nesting depth of its open scope,
+    so two threads entering the same one would overwrite each other's state.
+    This one instead calls `factory` for a fresh unit of work whenever a
+    scope opens in a context that has none, and tracks it in a ContextVar:
+    each thread and each task sees only its own. Nested scopes in the same
+    context reuse it, and attribute access (`uow.travel`, ...) resolves to
+    it.
+
+    `read_factory`, when given, builds the units of work that read_only()
+    scopes use.
+
+    A unit of work is closed once its outermost scope exits. Factories should
+    therefore share a connection pool, as SQLiteUnitOfWork.scoped() does;
+    otherwise every scope opens, and closes, a connection of its own.
+    Outside a scope, attributes such as `settings` resolve to an idle unit
+    of work from the factory, and close() closes it, along with whatever
+    `on_close` releases (the shared pools).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], UnitOfWork],
+        read_factory: Optional[Callable[[], UnitOfWork]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.factory = factory
+        self.read_factory = read_factory
+        self.on_close = on_close
+        self._current: ContextVar[Optional[UnitOfWork]] = ContextVar(
+            f"folio_scoped_uow_{id(self)}", default=None
+        )
+        # Built up front so that threads sharing this instance never write to it
+        self._idle = factory()
+        self._reader = (
+            ScopedUnitOfWork(read_factory) if read_factory is not None else self
+        )
+
+    def __enter__(self):
+        uow = self._current.get()
+        if uow is None:
+            uow = self.factory()
+            uow.__enter__()
+            self._current.set(uow)
+        else:
+            uow.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        uow = self._active()
+        try:
+            uow.__exit__(exc_type, exc, tb)
+        finally:
+            if not uow.in_scope:
+                self._current.set(None)
+                _close(uow)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes this class does not define itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._current.get() or self._idle, name)
+
+    @property
+    def in_scope(self) -> bool:
+        return self._current.get() is not None
+
+    def _start(self):
+        return self._active()._start()
+
+    def commit(self):
+        self._active().commit()
+
+    def rollback(self):
+        self._active().rollback()
+
+    def read_only(self) -> UnitOfWork:
+        return self if self.in_scope else self._reader
+
+    def close(self) -> None:
+        _close(self._idle)
+        if self._reader is not self:
+            self._reader.close()
+        if self.on_close is not None:
+            self.on_close()
+
+    def _active(self) -> UnitOfWork:
+        uow = self._current.get()
+        if uow is None:
+            raise UnitOfWorkClosedError(
+                "Unit of work used outside of a scope in this context"
+            )
+        return uow
+
+
+def _close(uow: UnitOfWork) -> None:
+    close = getattr(uow, "close", None)
+    if close is not None:
+        close()
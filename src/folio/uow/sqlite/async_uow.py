@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar
+
+import folio.repositories as repo
+from .coordinator import WriteCoordinator, DEFAULT_READERS
+from .profiles import Profile
+from .sqlite_uow import SQLiteUnitOfWork
+
+T = TypeVar("T")
+
+
+class AsyncSQLiteUnitOfWork:
+    """
+    An asyncio front for SQLite units of work.
+
+    sqlite3 calls block, so none of them run on the event loop. Writes go
+    through a WriteCoordinator, whose writer thread owns the writable
+    connection and runs one job at a time; reads run on a pool of reader
+    threads, each with its own read-only connection, so reads proceed
+    concurrently with each other and with the writer.
+
+    `async with uow:` opens a transaction on the writer. Coroutines outside
+    the scope wait for it to end before writing, while work done inside the
+    scope (including its reads) runs in the scope's transaction:
+
+        async with uow:
+            await uow.run(lambda u: u.travel.add(travel))
+            trips = await uow.read(lambda u: u.travel.list())
+    """
+
+    def __init__(
+        self,
+        db_path: str = "folio.db",
+        readers: int = DEFAULT_READERS,
+        date_encoding: repo.DateEncoding | None = None,
+        profile: str | Profile | None = None,
+        retry: repo.RetryPolicy | None = None,
+    ):
+        self.db_path = db_path
+        self.coordinator = WriteCoordinator(
+            db_path,
+            readers=readers,
+            date_encoding=date_encoding,
+            profile=profile,
+            retry=retry,
+        )
+        self._reader_threads = ThreadPoolExecutor(
+            readers, thread_name_prefix="folio-reader"
+        )
+        self._write_lock = asyncio.Lock()
+        # Nesting depth of `async with` scopes in the current task
+        self._depth: ContextVar[int] = ContextVar(f"folio_uow_{id(self)}", default=0)
+
+    async def __aenter__(self):
+        depth = self._depth.get()
+        if not depth:
+            await self._write_lock.acquire()
+        opened = threading.Event()
+
+        def enter(uow):
+            uow.__enter__()
+            opened.set()
+
+        try:
+            await self._finish(self._on_writer_scope(enter))
+        except BaseException as e:
+            # A cancelled enter job still runs, so the scope it may have
+            # opened is closed by the next job on the writer
+            def exit_if_opened(uow, error=e):
+                if opened.is_set():
+                    uow.__exit__(type(error), error, error.__traceback__)
+
+            await self._finish(self._on_writer_scope(exit_if_opened))
+            if not depth:
+                self._write_lock.release()
+            raise
+        self._depth.set(depth + 1)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        depth = self._depth.get() - 1
+        self._depth.set(depth)
+        try:
+            await self._finish(
+                self._on_writer_scope(lambda uow: uow.__exit__(exc_type, exc, tb))
+            )
+        finally:
+            if not depth:
+                self._write_lock.release()
+
+    async def run(self, fn: Callable[[SQLiteUnitOfWork], T]) -> T:
+        """
+        Call `fn` with the writer's unit of work, inside the current scope or,
+        outside of one, in a transaction of its own.
+        """
+        if self._depth.get():
+            return await self._on_writer(fn)
+        async with self._write_lock:
+            return await self._on_writer(fn)
+
+    async def read(self, fn: Callable[[SQLiteUnitOfWork], T]) -> T:
+        """
+        Call `fn` with a read-only unit of work on a reader thread, or with the
+        writer's inside a scope, so the scope sees its own writes.
+        """
+        if self._depth.get():
+            return await self.run(fn)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._reader_threads, self.coordinator.read, fn
+        )
+
+    def close(self) -> None:
+        """
+        Wait for pending jobs, then close every connection.
+        """
+        self._reader_threads.shutdown()
+        self.coordinator.close()
+
+    async def _on_writer(self, fn: Callable[[SQLiteUnitOfWork], T]) -> T:
+        return await asyncio.wrap_future(self.coordinator.submit(fn))
+
+    def _on_writer_scope(self, fn: Callable[[SQLiteUnitOfWork], T]) -> asyncio.Future:
+        # Scope jobs manage the transaction themselves and always run
+        return asyncio.wrap_future(self.coordinator.submit(fn, transaction=False))
+
+    async def _finish(self, job: asyncio.Future) -> Any:
+        """
+        Wait for a scope job. Cancellation does not skip the job, and only
+        takes effect once it is done, so scopes never overlap on the writer.
+        """
+        try:
+            return await asyncio.shield(job)
+        except asyncio.CancelledError:
+            if not job.done():
+                with contextlib.suppress(Exception):
+                    await job
+            raise
@@ -0,0 +1,179 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+import folio.repositories as repo
+from .pool import ConnectionPool
+from .profiles import Profile
+from .sqlite_uow import SQLiteUnitOfWork
+
+T = TypeVar("T")
+
+DEFAULT_READERS = 4
+
+
+@dataclass(frozen=True)
+class WriteStats:
+    submitted: int
+    completed: int
+    failed: int
+    queue_depth: int
+    max_queue_depth: int
+    # Seconds jobs spent queued before the writer picked them up
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_wait / finished if finished else 0.0
+
+
+class WriteCoordinator:
+    """
+    Serializes the writes of many threads through one writer thread.
+
+    SQLite allows a single writer at a time. Threads writing through their
+    own connections contend for the lock and fail with "database is locked",
+    and deferred transactions that upgrade to writes can deadlock each other.
+    Here every write job is queued instead, and the writer thread runs them
+    in order, each in a BEGIN IMMEDIATE transaction on its own connection.
+    Reads do not queue: read() runs on the calling thread, on a read-only
+    connection from a shared pool, in parallel with the writer.
+
+        coordinator = WriteCoordinator("folio.db")
+        coordinator.write(lambda uow: TravelService(uow).add("CAN", "USA", day))
+        trips = coordinator.read(lambda uow: uow.travel.list())
+    """
+
+    def __init__(
+        self,
+        db_path: str = "folio.db",
+        readers: int = DEFAULT_READERS,
+        date_encoding: repo.DateEncoding | None = None,
+        profile: str | Profile | None = None,
+        retry: repo.RetryPolicy | None = None,
+    ):
+        self.db_path = db_path
+        self.uow = SQLiteUnitOfWork(
+            db_path, date_encoding, profile=profile, immediate=True, retry=retry
+        )
+        self.reader_pool = ConnectionPool(
+            db_path,
+            size=readers,
+            date_encoding=date_encoding,
+            profile=profile,
+            read_only=True,
+            retry=retry,
+        )
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._drain, name="folio-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, fn: Callable[[SQLiteUnitOfWork], T], transaction: bool = True
+    ) -> Future[T]:
+        """
+        Queue `fn` to be called on the writer thread with the writer's unit of
+        work and return a future for its result. With `transaction` the call
+        runs in a scope of its own, committed when `fn` returns and rolled
+        back when it raises. Otherwise `fn` manages the scope itself, and is
+        run even if the future is cancelled meanwhile: a skipped scope exit
+        would leave the writer's transaction open for good.
+        """
+        future: Future[T] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write coordinator is closed")
+            self._submitted += 1
+            self._jobs.put((fn, transaction, future, time.perf_counter()))
+            self._max_depth = max(self._max_depth, self._jobs.qsize())
+        return future
+
+    def write(self, fn: Callable[[SQLiteUnitOfWork], T]) -> T:
+        """
+        Run `fn` in a write transaction on the writer thread and wait for it.
+        """
+        return self.submit(fn).result()
+
+    def read(self, fn: Callable[[SQLiteUnitOfWork], T]) -> T:
+        """
+        Call `fn` on this thread with a read-only unit of work.
+        """
+        # Units of work are not thread-safe, so each thread keeps its own
+        uow = getattr(self._local, "uow", None)
+        if uow is None:
+            uow = self._local.uow = SQLiteUnitOfWork(pool=self.reader_pool)
+        with uow:
+            return fn(uow)
+
+    def stats(self) -> WriteStats:
+        with self._lock:
+            return WriteStats(
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                queue_depth=self._jobs.qsize(),
+                max_queue_depth=self._max_depth,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+    def close(self) -> None:
+        """
+        Run the jobs already queued, stop the writer and close connections.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._jobs.put(None)
+        self._thread.join()
+        self.uow.close()
+        self.reader_pool.close()
+
+    def _drain(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            fn, transaction, future, queued_at = job
+            wait = time.perf_counter() - queued_at
+            if not future.set_running_or_notify_cancel() and transaction:
+                continue
+            try:
+                if transaction:
+                    with self.uow:
+                        result = fn(self.uow)
+                else:
+                    result = fn(self.uow)
+            except BaseException as e:
+                self._record(wait, failed=True)
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                self._record(wait, failed=False)
+                if not future.cancelled():
+                    future.set_result(result)
+
+    def _record(self, wait: float, failed: bool) -> None:
+        with self._lock:
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
@@ -0,0 +1,231 @@
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+import folio.repositories as repo
+from folio.common import PoolTimeoutError
+from .profiles import Profile, get_profile
+
+DEFAULT_POOL_SIZE = 4
+
+
+def supports_read_only(db_path: str) -> bool:
+    """
+    Whether `db_path` names a database file that a `mode=ro` URI can open:
+    in-memory and temporary databases, and paths already given as URIs,
+    cannot be
+    """
+    return db_path not in ("", ":memory:") and not db_path.startswith("file:")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    created: int
+    idle: int
+    in_use: int
+    discarded: int
+
+
+class ConnectionPool:
+    """
+    A bounded pool of connections to one SQLite database.
+
+    Connections are opened lazily, up to `size`, and kept open between units
+    of work so SQLite's page cache and prepared statements survive. Each new
+    connection is prepared once: the performance `profile` PRAGMAs are
+    applied, the schema is migrated, the date encoding is detected (or
+    converted to `date_encoding`), and `setup` is called with it.
+
+    A `read_only` pool opens connections through `mode=ro` URIs, which can
+    never write to the file. Such connections cannot migrate either, so the
+    schema is brought up to date once through a short-lived writable
+    connection before the first read-only one opens.
+
+    acquire() health-checks an idle connection before handing it out and
+    replaces it if it is no longer usable; release() rolls back anything left
+    uncommitted. `retry` sets each connection's busy timeout and is handed
+    to the units of work borrowing them. When every connection is in use, acquire() waits up to
+    `timeout` seconds (forever when None) and then raises PoolTimeoutError.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "folio.db",
+        size: int = DEFAULT_POOL_SIZE,
+        setup: Optional[Callable[[sqlite3.Connection], None]] = None,
+        date_encoding: Optional[repo.DateEncoding] = None,
+        timeout: Optional[float] = None,
+        profile: Optional[str | Profile] = None,
+        read_only: bool = False,
+        retry: Optional[repo.RetryPolicy] = None,
+    ):
+        if size < 1:
+            raise ValueError(f"size must be positive, got {size}")
+        if read_only and not supports_read_only(db_path):
+            raise ValueError(f"{db_path!r} cannot be opened read-only")
+
+        self.db_path = db_path
+        self.size = size
+        self.setup = setup
+        self.timeout = timeout
+        self.date_encoding = date_encoding
+        self.profile = get_profile(profile) if profile is not None else None
+        # Effective values of the profile's PRAGMAs, as read back from SQLite
+        self.settings: dict[str, Any] = {}
+        self.read_only = read_only
+        self.retry = retry
+        self._schema_ready = False
+
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._discarded = 0
+        self._in_use = 0
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError(
+                f"No connection to {self.db_path} became free within {self.timeout}s"
+            )
+
+        try:
+            conn = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_use += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+        else:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """
+        Close the idle connections; those in use are closed when released.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                size=self.size,
+                created=self._created,
+                idle=self._idle.qsize(),
+                in_use=self._in_use,
+                discarded=self._discarded,
+            )
+
+    def _checkout(self) -> sqlite3.Connection:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if self._healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only and not self._schema_ready:
+            writable = self._open(self.db_path)
+            try:
+                self._prepare_schema(writable)
+            finally:
+                writable.close()
+
+        if self.read_only:
+            conn = self._open(f"{Path(self.db_path).resolve().as_uri()}?mode=ro")
+        else:
+            conn = self._open(self.db_path)
+        try:
+            self._prepare(conn)
+        except BaseException:
+            conn.close()
+            raise
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _open(self, database: str) -> sqlite3.Connection:
+        return sqlite3.connect(
+            database,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=repo.CONNECTION_STATEMENT_CACHE_SIZE,
+            # Connections move between threads through the pool, but are only
+            # used by one unit of work at a time
+            check_same_thread=False,
+            uri=database.startswith("file:"),
+            # sqlite3's default busy timeout, unless a retry policy sets one
+            timeout=self.retry.busy_timeout if self.retry else 5.0,
+        )
+
+    def _prepare(self, conn: sqlite3.Connection) -> None:
+        if self.read_only:
+            if self.profile is not None:
+                self.settings = self.profile.apply(conn)
+            self.date_encoding = repo.date_encoding(conn)
+        else:
+            self._prepare_schema(conn)
+        if self.setup is not None:
+            self.setup(conn)
+
+    def _prepare_schema(self, conn: sqlite3.Connection) -> None:
+        if self.profile is not None:
+            self.settings = self.profile.apply(conn)
+        repo.migrate(conn)
+        if self.date_encoding is None:
+            self.date_encoding = repo.date_encoding(conn)
+        else:
+            self.date_encoding = repo.convert_dates(conn, self.date_encoding)
+        self._schema_ready = True
+
+    def _healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return not conn.in_transaction
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._discarded += 1
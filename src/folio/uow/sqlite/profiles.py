@@ -0,0 +1,92 @@
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any
+
+MiB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Profile:
+    """
+    A named set of PRAGMAs applied to every connection when it opens.
+
+    PRAGMAs are applied in order, so journal_mode, which must run outside a
+    transaction, goes first. A negative cache_size is a size in KiB.
+    """
+
+    name: str
+    pragmas: dict[str, Any] = field(default_factory=dict)
+
+    def apply(self, conn: sqlite3.Connection) -> dict[str, Any]:
+        """
+        Apply the PRAGMAs and return the settings SQLite actually uses, which
+        can differ from the requested ones (e.g. journal_mode on an in-memory
+        database, or mmap_size above the compile-time limit).
+        """
+        for pragma, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {pragma} = {value}").fetchall()
+        return {
+            pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in self.pragmas
+        }
+
+
+PROFILES = {
+    # WAL with a full fsync on every commit: nothing committed is lost, even
+    # on power failure, while readers still run alongside the writer
+    "durable": Profile(
+        "durable",
+        {
+            "journal_mode": "WAL",
+            "synchronous": "FULL",
+            "cache_size": -16 * 1024,
+        },
+    ),
+    # WAL syncs only at checkpoints: the file stays consistent, but a power
+    # failure can lose the last commits. The usual choice for applications
+    "balanced": Profile(
+        "balanced",
+        {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -32 * 1024,
+            "mmap_size": 64 * MiB,
+            "temp_store": "MEMORY",
+        },
+    ),
+    # Large imports: no fsyncs and rare checkpoints. Safe against application
+    # crashes, but an OS crash or power failure may corrupt the database
+    "bulk-load": Profile(
+        "bulk-load",
+        {
+            "journal_mode": "WAL",
+            "synchronous": "OFF",
+            "cache_size": -128 * 1024,
+            "mmap_size": 256 * MiB,
+            "temp_store": "MEMORY",
+            "wal_autocheckpoint": 10000,
+        },
+    ),
+    # Reporting: a large page cache and memory-mapped reads
+    "read-mostly": Profile(
+        "read-mostly",
+        {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -64 * 1024,
+            "mmap_size": 256 * MiB,
+            "temp_store": "MEMORY",
+        },
+    ),
+}
+
+
+def get_profile(profile: str | Profile) -> Profile:
+    if isinstance(profile, Profile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown profile {profile!r}; expected one of {', '.join(PROFILES)}"
+        ) from None
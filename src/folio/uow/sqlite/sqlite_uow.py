@@ -1,53 +1,236 @@
-import sqlite3
+from typing import Any
 
 from ..unit_of_work import UnitOfWork
+from ..scoped import ScopedUnitOfWork
+from .pool import ConnectionPool, DEFAULT_POOL_SIZE, supports_read_only
+from .profiles import Profile
+from folio.common import UnitOfWorkClosedError
 
 import folio.repositories as repo
 
 
-class SQLiteUnitOfWork(UnitOfWork):
+class LazyRepository:
+    """
+    A unit of work attribute holding a repository, built on first access
+    within a scope on the scope's connection and reused until it ends.
+    """
 
-    def __init__(self, db_path="folio.db"):
-        self.db_path = db_path
+    def __init__(self, repository_class: type[repo.SQLiteRepository]):
+        self.repository_class = repository_class
 
-    def _start(self):
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.execute("BEGIN")
-        return self
+    def __set_name__(self, owner, name):
+        self.name = name
 
-    def commit(self):
-        self.conn.execute("COMMIT")
+    def __get__(self, uow, owner=None):
+        if uow is None:
+            return self
+        try:
+            return uow._repositories[self.name]
+        except KeyError:
+            pass
 
-    def rollback(self):
-        self.conn.execute("ROLLBACK")
+        if uow.conn is None:
+            raise UnitOfWorkClosedError(
+                f"{self.name} repository used outside of a unit of work scope"
+            )
+        repository = self.repository_class(uow.conn, uow.date_encoding, uow.retry)
+        if uow.record_cache is not None:
+            repository = repo.CachedRepository(repository, uow.record_cache)
+        uow._repositories[self.name] = repository
+        return repository
 
-    def _cleanup(self):
-        self.conn.close()
 
+class SQLiteUnitOfWork(UnitOfWork):
+    """
+    One transaction over every domain. Repositories are created lazily, so
+    a scope only pays for the ones it uses.
+    """
+
+    travel = LazyRepository(repo.SQLiteTravelRepository)
+    address = LazyRepository(repo.SQLiteAddressRepository)
+    employment = LazyRepository(repo.SQLiteEmploymentRepository)
+    work = LazyRepository(repo.SQLiteWorkRepository)
+
+    def __init__(
+        self,
+        db_path="folio.db",
+        date_encoding: repo.DateEncoding | None = None,
+        pool: ConnectionPool | None = None,
+        profile: str | Profile | None = None,
+        read_only: bool = False,
+        immediate: bool = False,
+        retry: repo.RetryPolicy | None = None,
+        record_cache: repo.RecordCache | None = None,
+    ):
+        """
+        Connections are borrowed from `pool`, or from a private pool on
+        `db_path` kept for the lifetime of this unit of work.
+
+        `date_encoding` converts the database to that date storage on first
+        use; by default the encoding already used by the file is kept.
+        `profile` names the PRAGMA set applied to new connections (durable,
+        balanced, bulk-load or read-mostly); by default SQLite's own defaults
+        are kept. `read_only` opens connections that cannot write. `retry`
+        sets the busy timeout and retries BEGIN and COMMIT when they fail on
+        another connection's lock; repository statements, which run inside
+        the transaction, are only counted in its stats. These four are
+        ignored when an existing `pool` is passed.
+
+        `immediate` starts transactions with BEGIN IMMEDIATE, taking the write
+        lock up front: concurrent writers then wait for each other (or time
+        out) at BEGIN, instead of failing with "database is locked" when a
+        deferred transaction tries to upgrade to a write.
+
+        `record_cache` puts every repository behind a CachedRepository, so
+        repeated get() calls on a connection skip SQLite while the data is
+        unchanged.
+        """
+        self.pool = pool or ConnectionPool(
+            db_path,
+            date_encoding=date_encoding,
+            profile=profile,
+            read_only=read_only,
+            retry=retry,
+        )
+        # Pools passed in belong to the caller, who closes them
+        self._owns_pool = pool is None
+        self.db_path = self.pool.db_path
+        self.retry = self.pool.retry
+        self.immediate = immediate
+        self.record_cache = record_cache
+        self.conn = None
+        self._repositories: dict[str, repo.Repository] = {}
+        self._reader: SQLiteUnitOfWork | None = None
+
+    @classmethod
+    def scoped(
+        cls,
+        db_path="folio.db",
+        size: int = DEFAULT_POOL_SIZE,
+        immediate: bool = True,
+        record_cache: repo.RecordCache | None = None,
+        **options,
+    ) -> ScopedUnitOfWork:
+        """
+        Return a unit of work that one service instance can share across
+        threads and tasks: every concurrent scope gets its own unit of work,
+        borrowing from a writable pool of `size` connections, or from a
+        read-only pool for read_only() scopes. Writers start with BEGIN
+        IMMEDIATE by default, as they may now run side by side. `record_cache`
+        is shared by all of them; `options` are passed on to both pools
+        (date_encoding, profile, retry, timeout), which close() closes.
+        """
+
+        pool = ConnectionPool(db_path, size=size, **options)
+        pools = [pool]
+        read_factory = None
+        if supports_read_only(db_path):
+            readers = ConnectionPool(db_path, size=size, read_only=True, **options)
+            pools.append(readers)
+            read_factory = lambda: cls(pool=readers, record_cache=record_cache)
+
+        def close():
+            for shared in pools:
+                shared.close()
+
+        return ScopedUnitOfWork(
+            lambda: cls(pool=pool, immediate=immediate, record_cache=record_cache),
+            read_factory,
+            on_close=close,
+        )
 
-class TravelSQLiteUoW(SQLiteUnitOfWork):
     def _start(self):
-        super()._start()
-        self.travel = repo.SQLiteTravelRepository(self.conn)
+        self.conn = self.pool.acquire()
+        self.date_encoding = self.pool.date_encoding
+        if self.immediate and not self.pool.read_only:
+            begin = "BEGIN IMMEDIATE"
+        else:
+            # Deferred: no lock is taken until the first statement, so read-only
+            # scopes never block writers and see one snapshot throughout
+            begin = "BEGIN DEFERRED"
+        try:
+            self._execute(begin)
+        except BaseException:
+            self.pool.release(self.conn)
+            self.conn = None
+            raise
         return self
 
+    def commit(self):
+        self._execute("COMMIT")
 
-class EmploymentSQLiteUoW(SQLiteUnitOfWork):
-    def _start(self):
-        super()._start()
-        self.employment = repo.SQLiteEmploymentRepository(self.conn)
-        return self
+    def rollback(self):
+        self.conn.execute("ROLLBACK")
 
+    def _execute(self, sql: str) -> None:
+        if self.retry is None:
+            self.conn.execute(sql)
+        else:
+            self.retry.call(self.conn.execute, sql)
 
-class AddressSQLiteUoW(SQLiteUnitOfWork):
-    def _start(self):
-        super()._start()
-        self.address = repo.SQLiteAddressRepository(self.conn)
-        return self
+    def _savepoint(self, level: int):
+        self.conn.execute(f"SAVEPOINT uow_{level}")
 
+    def _release_savepoint(self, level: int):
+        self.conn.execute(f"RELEASE uow_{level}")
 
-class WorkSQLiteUoW(SQLiteUnitOfWork):
-    def _start(self):
-        super()._start()
-        self.work = repo.SQLiteWorkRepository(self.conn)
-        return self
+    def _rollback_to_savepoint(self, level: int):
+        # ROLLBACK TO keeps the savepoint open, so it is released as well
+        self.conn.execute(f"ROLLBACK TO uow_{level}")
+        self.conn.execute(f"RELEASE uow_{level}")
+
+    def _cleanup(self):
+        for repository in self._repositories.values():
+            repository.close()
+        self._repositories = {}
+        self.pool.release(self.conn)
+        self.conn = None
+
+    def read_only(self) -> "SQLiteUnitOfWork":
+        """
+        Return a unit of work of the same kind backed by read-only connections
+        to the same database, created on first use and reused afterwards.
+
+        Inside an open scope this unit of work is returned instead, so reads
+        join the scope as a nested one and see its uncommitted writes. So it
+        is for databases that cannot be opened read-only, such as :memory:.
+        """
+        if self.pool.read_only or self.in_scope or not supports_read_only(self.db_path):
+            return self
+        if self._reader is None:
+            self._reader = type(self)(
+                pool=ConnectionPool(
+                    self.db_path,
+                    date_encoding=self.pool.date_encoding,
+                    profile=self.pool.profile,
+                    read_only=True,
+                    retry=self.pool.retry,
+                ),
+                record_cache=self.record_cache,
+            )
+        return self._reader
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        """
+        Effective values of the profile's PRAGMAs
+        """
+        return self.pool.settings
+
+    def close(self):
+        """
+        Close the connections of the pools this unit of work opened; a pool
+        passed in is left to its owner
+        """
+        if self._owns_pool:
+            self.pool.close()
+        if self._reader is not None:
+            self._reader.pool.close()
+
+
+# The per-domain units of work predate lazy repositories; every domain is
+# now available on SQLiteUnitOfWork itself
+TravelSQLiteUoW = SQLiteUnitOfWork
+EmploymentSQLiteUoW = SQLiteUnitOfWork
+AddressSQLiteUoW = SQLiteUnitOfWork
+WorkSQLiteUoW = SQLiteUnitOfWork
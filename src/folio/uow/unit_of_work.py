@@ -2,17 +2,44 @@ from abc import ABC, abstractmethod
 
 
 class UnitOfWork(ABC):
+    """
+    Scopes are re-entrant: only the outermost `with` block starts and ends
+    the transaction, and each nested block runs in a savepoint that is
+    released on success or rolled back on error, leaving the outer
+    transaction usable.
+    """
+
+    # Number of `with` blocks currently open on this unit of work
+    _depth = 0
 
     def __enter__(self):
-        self._start()
+        if self._depth:
+            self._savepoint(self._depth)
+        else:
+            self._start()
+        self._depth += 1
         return self
 
     def __exit__(self, exc_type, *_):
-        if exc_type:
-            self.rollback()
-        else:
-            self.commit()
-        self._cleanup()
+        self._depth -= 1
+        if self._depth:
+            if exc_type:
+                self._rollback_to_savepoint(self._depth)
+            else:
+                self._release_savepoint(self._depth)
+            return
+
+        try:
+            if exc_type:
+                self.rollback()
+            else:
+                self.commit()
+        finally:
+            self._cleanup()
+
+    @property
+    def in_scope(self) -> bool:
+        return self._depth > 0
 
     @abstractmethod
     def _start(self):
@@ -25,3 +52,27 @@ class UnitOfWork(ABC):
     @abstractmethod
     def rollback(self):
         pass
+
+    def _cleanup(self):
+        pass
+
+    # Nested scope hooks, called with the nesting level of the scope. Units
+    # of work without savepoint support treat nested scopes as part of the
+    # outer transaction
+
+    def _savepoint(self, level: int):
+        pass
+
+    def _release_savepoint(self, level: int):
+        pass
+
+    def _rollback_to_savepoint(self, level: int):
+        pass
+
+    def read_only(self) -> "UnitOfWork":
+        """
+        Return a unit of work for scopes that only read. Implementations that
+        can serve reads more cheaply override this; by default it is this
+        same unit of work.
+        """
+        return self
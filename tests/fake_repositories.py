@@ -3,16 +3,26 @@ from typing import Optional, List, Dict
 from abc import ABC, abstractmethod
 
 from folio import models
+from folio.common import DuplicateRecordError
 from folio.repositories import Repository
 
 
 class FakeRepository(Repository[models.R]):
+    # Mirrors the UNIQUE constraint of the matching SQLite table
+    UNIQUE_FIELDS: tuple[str, ...] = ()
+
     def __init__(self):
         self._data: Dict[int, models.R] = {}
         self._identity_map: Dict[int, int] = {}
         self._next_id = 1
 
     def add(self, record: models.R) -> int:
+        key = tuple(getattr(record, field) for field in self.UNIQUE_FIELDS)
+        if key and None not in key:
+            for existing in self._data.values():
+                if tuple(getattr(existing, f) for f in self.UNIQUE_FIELDS) == key:
+                    raise DuplicateRecordError(f"Duplicate record: {record}")
+
         self._data[self._next_id] = record
         self._identity_map[id(record)] = self._next_id
         self._next_id += 1
@@ -39,9 +49,11 @@ class FakeRepository(Repository[models.R]):
                 setattr(record, field, value)
         return 1
 
-    def delete(self, key: int | None = None, **filters):
+    def delete(self, key: int | None = None, returning: bool = False, **filters):
         if key:
             row = self._data.pop(key, 0)
+            if returning:
+                return [row] if row else []
             return row
 
         matching_keys = []
@@ -54,10 +66,14 @@ class FakeRepository(Repository[models.R]):
             if matched:
                 matching_keys.append(db_key)
 
-        for db_key in matching_keys:
-            self._data.pop(db_key)
+        deleted = [self._data.pop(db_key) for db_key in matching_keys]
+        return deleted if returning else len(deleted)
+
+    def count(self, **filters) -> int:
+        return len(self._apply_filters(filters))
 
-        return len(matching_keys)
+    def exists(self, **filters) -> bool:
+        return bool(self._apply_filters(filters))
 
     def _apply_filters(self, filters: dict) -> List[models.R]:
         items = self.list()
@@ -71,6 +87,7 @@ class FakeRepository(Repository[models.R]):
 
 
 class FakeTravelRepository(FakeRepository[models.Travel]):
+    UNIQUE_FIELDS = ("origin", "destination", "date")
 
     def find(
         self,
@@ -88,6 +105,7 @@ class FakeTravelRepository(FakeRepository[models.Travel]):
 
 
 class FakeEmploymentRepository(FakeRepository[models.Employment]):
+    UNIQUE_FIELDS = ("company", "start")
 
     def find(
         self,
@@ -111,6 +129,7 @@ class FakeEmploymentRepository(FakeRepository[models.Employment]):
 
 
 class FakeAddressRepository(FakeRepository[models.Address]):
+    UNIQUE_FIELDS = ("street", "city", "start", "end")
 
     def find(
         self,
@@ -138,6 +157,7 @@ class FakeAddressRepository(FakeRepository[models.Address]):
 
 
 class FakeWorkRepository(FakeRepository[models.Work]):
+    UNIQUE_FIELDS = ("title", "author", "year")
 
     def find(
         self,
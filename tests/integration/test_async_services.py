@@ -0,0 +1,141 @@
+import asyncio
+import datetime as dt
+import threading
+
+import pytest
+
+from folio.services import AsyncTravelService, AsyncWorkService, TravelService
+from folio.uow import AsyncSQLiteUnitOfWork
+
+
+@pytest.fixture
+def async_uow(fake_db):
+    uow = AsyncSQLiteUnitOfWork(fake_db, readers=2, profile="balanced")
+    yield uow
+    uow.close()
+
+
+def test_async_services_round_trip(async_uow):
+    async def scenario():
+        travel = AsyncTravelService(async_uow)
+        work = AsyncWorkService(async_uow)
+        await asyncio.gather(
+            travel.add("CAN", "USA", "2000-01-01"),
+            travel.add("USA", "MEX", "2000-01-02"),
+            work.add("Author", "Title", 2000),
+        )
+        return await asyncio.gather(
+            travel.list(), travel.find(origin="USA"), work.list()
+        )
+
+    trips, found, works = asyncio.run(scenario())
+
+    assert len(trips) == 2
+    assert found[0].date == dt.date(2000, 1, 2)
+    assert works[0].title == "Title"
+
+
+def test_statements_never_run_on_the_event_loop(async_uow):
+    threads = set()
+
+    async def scenario():
+        await async_uow.run(lambda uow: threads.add(threading.current_thread()))
+        await async_uow.read(lambda uow: threads.add(threading.current_thread()))
+
+    asyncio.run(scenario())
+
+    assert threading.main_thread() not in threads
+    assert len(threads) == 2
+
+
+def test_scope_serializes_writers_and_sees_its_own_writes(async_uow):
+    service = AsyncTravelService(async_uow)
+
+    async def scoped():
+        async with service.batch():
+            await service.add("CAN", "USA", "2000-01-01")
+            inside = await service.list()
+            await asyncio.sleep(0.05)
+            await service.add("CAN", "USA", "2000-01-02")
+        return len(inside)
+
+    async def outside():
+        await asyncio.sleep(0)
+        # Readers do not wait for the scope and see only committed data
+        seen = len(await service.list())
+        await service.add("USA", "MEX", "2000-01-03")
+        return seen
+
+    async def scenario():
+        await service.list()
+        return await asyncio.gather(scoped(), outside())
+
+    inside, seen = asyncio.run(scenario())
+
+    assert inside == 1
+    assert seen == 0
+    assert len(asyncio.run(service.list())) == 3
+
+
+def test_failed_scope_rolls_back(async_uow):
+    service = AsyncTravelService(async_uow)
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            async with service.batch():
+                await service.add("CAN", "USA", "2000-01-01")
+                await service.add("CAN", "USA", "2000-01-01")
+        return await service.list()
+
+    assert asyncio.run(scenario()) == []
+
+
+def add_travel(uow):
+    return TravelService(uow).add("CAN", "USA", "2000-01-01")
+
+
+def block_writer(uow):
+    release = threading.Event()
+    uow.coordinator.submit(lambda _: release.wait(), transaction=False)
+    return release
+
+
+def test_cancelling_a_scope_exit_still_commits(async_uow):
+    async def scenario():
+        async def scope():
+            async with async_uow:
+                await async_uow.run(add_travel)
+                release.append(block_writer(async_uow))
+
+        release = []
+        task = asyncio.create_task(scope())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        release[0].set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await async_uow.read(lambda uow: uow.travel.list())
+
+    assert len(asyncio.run(scenario())) == 1
+    assert not async_uow.coordinator.uow.in_scope
+
+
+def test_cancelling_a_scope_entry_closes_the_scope(async_uow):
+    async def scenario():
+        release = block_writer(async_uow)
+
+        async def scope():
+            async with async_uow:
+                pass
+
+        task = asyncio.create_task(scope())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await async_uow.run(add_travel)
+        return await async_uow.read(lambda uow: uow.travel.list())
+
+    assert len(asyncio.run(scenario())) == 1
+    assert not async_uow.coordinator.uow.in_scope
@@ -0,0 +1,55 @@
+import threading
+import datetime as dt
+
+from folio.repositories import RetryPolicy, SQLiteTravelRepository, StatementCache
+from folio.services import TravelService
+from folio.uow import SQLiteUnitOfWork
+
+
+def run_threads(target, count=8):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_parallel_reads_share_one_service(fake_db):
+    service = TravelService(SQLiteUnitOfWork.scoped(fake_db, profile="read-mostly"))
+    for day in range(1, 11):
+        service.add("CAN", "USA", dt.date(2000, 1, day))
+
+    before = SQLiteTravelRepository.statement_cache_stats()
+    results = {}
+
+    def read(n):
+        results[n] = [
+            len(service.find(date=dt.date(2000, 1, day))) for day in range(1, 11)
+        ] + [len(service.list())]
+
+    run_threads(read)
+
+    assert results == {n: [1] * 10 + [10] for n in range(8)}
+    after = SQLiteTravelRepository.statement_cache_stats()
+    assert (after.hits + after.misses) - (before.hits + before.misses) == 80
+
+
+def test_statement_cache_counts_every_thread():
+    cache = StatementCache()
+    built = []
+
+    def lookup(n):
+        for _ in range(1000):
+            cache.get("select", built.append, n)
+
+    run_threads(lookup)
+
+    assert len(built) == 1
+    assert cache.stats().hits == 7999
+    assert cache.stats().misses == 1
+
+
+def test_retry_policy_counts_every_thread():
+    retry = RetryPolicy()
+    run_threads(lambda n: [retry.call(int, n) for _ in range(1000)])
+    assert retry.stats().calls == 8000
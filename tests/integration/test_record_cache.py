@@ -0,0 +1,100 @@
+import pytest
+import sqlite3
+import datetime as dt
+
+from folio.models import Address, Travel
+from folio.repositories import CachedRepository, RecordCache
+from folio.uow import SQLiteUnitOfWork
+
+
+@pytest.fixture
+def cached(fake_db):
+    cache = RecordCache()
+    uow = SQLiteUnitOfWork(fake_db, record_cache=cache)
+    with uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 2), ""))
+    return uow, cache
+
+
+def test_repeated_gets_are_served_from_the_cache(cached):
+    uow, cache = cached
+    with uow:
+        assert isinstance(uow.travel, CachedRepository)
+        first = uow.travel.get(1)
+    with uow:
+        second = uow.travel.get(1)
+        assert second.destination == "USA"
+
+    assert second is not first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_writes_through_the_repository_invalidate(cached):
+    uow, cache = cached
+    with uow:
+        uow.travel.get(1)
+        uow.travel.update(1, destination="FRA")
+        assert uow.travel.get(1).destination == "FRA"
+    with uow:
+        assert uow.travel.get(1).destination == "FRA"
+    assert cache.stats().invalidations == 1
+
+
+def test_reads_other_than_get_leave_the_cache_alone(fake_db):
+    cache = RecordCache()
+    uow = SQLiteUnitOfWork(fake_db, record_cache=cache)
+    with uow:
+        uow.address.add(
+            Address(dt.date(2000, 1, 1), None, "1 St", "Vancouver", "BC", "CA", "V")
+        )
+    with uow:
+        uow.address.get(1)
+        assert len(uow.address.find_open()) == 1
+        assert uow.address.count() == 1
+        uow.address.get(1)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.invalidations) == (1, 0)
+
+
+def test_rolled_back_writes_leave_nothing_stale(cached):
+    uow, _ = cached
+    with pytest.raises(RuntimeError):
+        with uow:
+            uow.travel.update(1, destination="FRA")
+            assert uow.travel.get(1).destination == "FRA"
+            raise RuntimeError
+    with uow:
+        assert uow.travel.get(1).destination == "USA"
+
+
+def test_commits_by_other_connections_invalidate(cached, fake_db):
+    uow, cache = cached
+    with uow:
+        uow.travel.get(1)
+
+    other = sqlite3.connect(fake_db)
+    with other:
+        other.execute("UPDATE travel SET destination = 'FRA' WHERE id = 1")
+    other.close()
+
+    with uow:
+        assert uow.travel.get(1).destination == "FRA"
+    assert cache.stats().hits == 0
+
+
+def test_least_recently_used_records_are_evicted(fake_db):
+    cache = RecordCache(maxsize=1)
+    uow = SQLiteUnitOfWork(fake_db, record_cache=cache)
+    with uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 2), ""))
+    with uow:
+        uow.travel.get(1)
+        uow.travel.get(2)
+        uow.travel.get(2)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 2, 1, 1)
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import datetime as dt
+
+import pytest
+
+from folio.common import UnitOfWorkClosedError
+from folio.repositories import RetryPolicy
+from folio.services import TravelService
+from folio.uow import SQLiteUnitOfWork
+
+
+def test_one_service_serves_many_threads(fake_db):
+    uow = SQLiteUnitOfWork.scoped(fake_db, profile="balanced", retry=RetryPolicy())
+    service = TravelService(uow)
+    errors = []
+
+    def work(n):
+        try:
+            for i in range(10):
+                service.add("CAN", "USA", dt.date(2000 + n, 1, 1 + i))
+                service.find(date=dt.date(2000 + n, 1, 1 + i))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(service.list()) == 80
+    uow.close()
+
+
+def test_tasks_get_their_own_unit_of_work(fake_db):
+    uow = SQLiteUnitOfWork.scoped(fake_db)
+    reader = uow.read_only()
+    inside = asyncio.Barrier(2)
+
+    async def task():
+        with reader:
+            conn = reader.conn
+            await inside.wait()
+            assert reader.conn is conn
+            return conn
+
+    async def main():
+        return await asyncio.gather(task(), task())
+
+    first, second = asyncio.run(main())
+    assert first is not second
+    uow.close()
+
+
+def test_nested_scopes_share_a_unit_of_work(fake_db):
+    uow = SQLiteUnitOfWork.scoped(fake_db)
+    with uow:
+        conn = uow.conn
+        with uow:
+            assert uow.conn is conn
+        assert uow.in_scope
+    assert not uow.in_scope
+    uow.close()
+
+
+def test_scoped_unit_of_work_outside_a_scope(fake_db):
+    uow = SQLiteUnitOfWork.scoped(fake_db)
+    with pytest.raises(UnitOfWorkClosedError):
+        uow.travel
+    uow.close()
+
+
+def test_units_of_work_from_a_plain_factory_are_closed(fake_db):
+    created = []
+
+    def factory():
+        created.append(SQLiteUnitOfWork(fake_db))
+        return created[-1]
+
+    service = TravelService(factory)
+    service.add("CAN", "USA", dt.date(2000, 1, 1))
+    assert len(service.list()) == 1
+
+    # The idle unit of work, then one per scope
+    assert len(created) == 3
+    assert all(uow.pool.stats().idle == 0 for uow in created[1:])
+    service.uow.close()
+
+
+def test_scoped_unit_of_work_closes_its_pools(fake_db):
+    uow = SQLiteUnitOfWork.scoped(fake_db, profile="balanced")
+    service = TravelService(uow)
+    service.add("CAN", "USA", dt.date(2000, 1, 1))
+    service.list()
+
+    assert uow.settings["journal_mode"] == "wal"
+    writer, reader = uow.pool, uow.read_only().pool
+    assert writer is not reader
+    uow.close()
+    assert writer.stats().idle == reader.stats().idle == 0
+    with pytest.raises(RuntimeError, match="closed"):
+        service.list()
@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+import time
+import datetime as dt
+
+from folio.models import Address, Travel
+from folio.repositories import DateEncoding, convert_dates, date_encoding
+from folio.uow import AddressSQLiteUoW, TravelSQLiteUoW
+
+
+def add_travels(uow):
+    uow.travel.add_many(
+        [
+            Travel("CAN", "USA", dt.date(1999, 12, 31), ""),
+            Travel("USA", "MEX", dt.date(2000, 1, 1), ""),
+            Travel("MEX", "CAN", dt.date(2000, 6, 15), ""),
+        ]
+    )
+
+
+def test_ordinal_dates_round_trip(fake_db):
+    with TravelSQLiteUoW(fake_db, DateEncoding.ORDINAL) as uow:
+        add_travels(uow)
+
+    with TravelSQLiteUoW(fake_db) as uow:
+        assert uow.date_encoding is DateEncoding.ORDINAL
+        assert [t.date for t in uow.travel.list()] == [
+            dt.date(1999, 12, 31),
+            dt.date(2000, 1, 1),
+            dt.date(2000, 6, 15),
+        ]
+        assert uow.travel.find(date="2000-01-01")[0].destination == "MEX"
+        stored = uow.conn.execute("SELECT DISTINCT typeof(date) FROM travel")
+        assert stored.fetchall() == [("integer",)]
+
+
+def test_ordinal_dates_in_queries(fake_db):
+    with TravelSQLiteUoW(fake_db, DateEncoding.ORDINAL) as uow:
+        add_travels(uow)
+
+        query = uow.travel.query().where(
+            date__between=(dt.date(2000, 1, 1), "2000-12-31")
+        )
+        assert [t.origin for t in query.order_by("date")] == ["USA", "MEX"]
+        assert uow.travel.aggregate(group_by="date__year") == [(1999, 1), (2000, 2)]
+
+        first = uow.travel.page(limit=2, order_by="date")
+        second = uow.travel.page(after=first.next_cursor, limit=2, order_by="date")
+        assert [t.origin for t in second] == ["MEX"]
+
+
+def test_convert_existing_database(fake_db):
+    with AddressSQLiteUoW(fake_db) as uow:
+        uow.address.add(
+            Address(
+                dt.date(2020, 1, 1), None, "1 Main St", "Vancouver", "BC", "CA", "V6Y"
+            )
+        )
+    with TravelSQLiteUoW(fake_db) as uow:
+        add_travels(uow)
+        uow.travel.delete(origin="MEX")
+        before = uow.travel.list()
+        assert uow.date_encoding is DateEncoding.ISO
+
+    with TravelSQLiteUoW(fake_db, DateEncoding.ORDINAL) as uow:
+        assert uow.travel.list() == before
+        ids = uow.conn.execute("SELECT id FROM travel ORDER BY id").fetchall()
+        assert ids == [(1,), (2,)]
+        new_id = uow.travel.add(Travel("MEX", "CAN", dt.date(2000, 6, 15), ""))
+        assert new_id == 4
+
+    conn = sqlite3.connect(fake_db)
+    assert date_encoding(conn) is DateEncoding.ORDINAL
+    index = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?"
+    assert conn.execute(index, ("travel_date",)).fetchone()
+    assert conn.execute(index, ("address_open",)).fetchone()
+
+    with AddressSQLiteUoW(fake_db) as uow:
+        (address,) = uow.address.find_open()
+        assert (address.start, address.end) == (dt.date(2020, 1, 1), None)
+
+    with TravelSQLiteUoW(fake_db, DateEncoding.ISO) as uow:
+        assert [t.date for t in uow.travel.list()] == [
+            dt.date(1999, 12, 31),
+            dt.date(2000, 1, 1),
+            dt.date(2000, 6, 15),
+        ]
+        stored = uow.conn.execute("SELECT DISTINCT typeof(date) FROM travel")
+        assert stored.fetchall() == [("text",)]
+
+
+def test_projections_return_dates_in_every_encoding(fake_db):
+    results = []
+    for encoding in (DateEncoding.ISO, DateEncoding.ORDINAL):
+        with TravelSQLiteUoW(fake_db, encoding) as uow:
+            uow.travel.delete_many(range(1, 10))
+            add_travels(uow)
+            assert uow.date_encoding is encoding
+            results.append(
+                (
+                    uow.travel.query().order_by("date").values_list("date", flat=True),
+                    uow.travel.aggregate(metrics={"first": ("min", "date")}),
+                    uow.travel.aggregate(group_by="date", metrics={"n": "count"})[0],
+                )
+            )
+
+    assert results[0] == results[1]
+    dates, first, group = results[0]
+    assert dates[0] == first[0].first == group.date == dt.date(1999, 12, 31)
+
+
+def test_concurrent_conversions_convert_once(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        add_travels(uow)
+        before = uow.travel.list()
+
+    # Both connections see ISO dates, then queue up behind the blocker's lock
+    blocker = sqlite3.connect(fake_db, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    errors = []
+
+    def convert():
+        conn = sqlite3.connect(fake_db, timeout=10, isolation_level=None)
+        try:
+            convert_dates(conn, DateEncoding.ORDINAL)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=convert) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    blocker.execute("ROLLBACK")
+    blocker.close()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with TravelSQLiteUoW(fake_db) as uow:
+        assert uow.date_encoding is DateEncoding.ORDINAL
+        assert uow.travel.list() == before
@@ -0,0 +1,75 @@
+import sqlite3
+
+from folio.repositories import Migration, MIGRATIONS, migrate
+from folio.repositories.sql.migrations import LATEST_VERSION, TRAVEL_TABLE
+from folio.uow import TravelSQLiteUoW
+
+
+def traced(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return statements
+
+
+def test_migrate_creates_schema_on_fresh_database(fake_db):
+    conn = sqlite3.connect(fake_db)
+
+    assert migrate(conn) == LATEST_VERSION
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert {"travel", "employment", "address", "work", "travel_date"} <= tables
+
+
+def test_migrate_skips_ddl_when_up_to_date(fake_db):
+    migrate(sqlite3.connect(fake_db))
+
+    conn = sqlite3.connect(fake_db)
+    statements = traced(conn)
+    migrate(conn)
+
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_migrate_upgrades_unversioned_files(fake_db):
+    conn = sqlite3.connect(fake_db)
+    conn.execute(TRAVEL_TABLE)
+    conn.execute("INSERT INTO travel VALUES (1, 'CAN', 'USA', '2000-01-01', '')")
+    conn.commit()
+
+    migrate(conn)
+
+    assert conn.execute("SELECT COUNT(*) FROM travel").fetchone()[0] == 1
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == LATEST_VERSION
+
+
+def test_migrate_applies_only_pending_steps(fake_db):
+    conn = sqlite3.connect(fake_db)
+    migrate(conn)
+    extra = Migration(
+        LATEST_VERSION + 1, "Add notes index", ("CREATE INDEX n ON travel (notes)",)
+    )
+
+    statements = traced(conn)
+    assert migrate(conn, MIGRATIONS + (extra,)) == LATEST_VERSION + 1
+
+    assert "CREATE INDEX n ON travel (notes)" in statements
+    assert not any("CREATE TABLE" in statement for statement in statements)
+
+
+def test_unit_of_work_runs_no_ddl_after_first_migration(fake_db, monkeypatch):
+    with TravelSQLiteUoW(fake_db):
+        pass
+
+    connect = sqlite3.connect
+    statements = []
+
+    def tracing_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracing_connect)
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.list()
+
+    assert statements
+    assert not any("CREATE" in statement for statement in statements)
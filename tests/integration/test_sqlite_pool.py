@@ -0,0 +1,72 @@
+import pytest
+import datetime as dt
+
+from folio.common import PoolTimeoutError
+from folio.models import Travel
+from folio.uow import ConnectionPool, PoolStats, TravelSQLiteUoW, WorkSQLiteUoW
+
+
+def test_unit_of_work_reuses_its_connection(fake_db):
+    uow = TravelSQLiteUoW(fake_db)
+    connections = []
+    for _ in range(3):
+        with uow:
+            connections.append(uow.conn)
+            uow.travel.list()
+
+    assert len(set(map(id, connections))) == 1
+    assert uow.pool.stats() == PoolStats(
+        size=uow.pool.size, created=1, idle=1, in_use=0, discarded=0
+    )
+
+
+def test_setup_runs_once_per_connection(fake_db):
+    prepared = []
+    pool = ConnectionPool(fake_db, size=2, setup=prepared.append)
+
+    with pool.connection() as first, pool.connection() as second:
+        assert first is not second
+    with TravelSQLiteUoW(pool=pool), WorkSQLiteUoW(pool=pool):
+        pass
+
+    assert len(prepared) == 2
+
+
+def test_units_of_work_can_share_a_pool(fake_db):
+    pool = ConnectionPool(fake_db)
+    with TravelSQLiteUoW(pool=pool) as uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    with TravelSQLiteUoW(pool=pool) as uow:
+        assert len(uow.travel.list()) == 1
+    assert pool.stats().created == 1
+
+
+def test_broken_connections_are_replaced(fake_db):
+    pool = ConnectionPool(fake_db, size=1)
+    with pool.connection() as conn:
+        pass
+    conn.close()
+
+    with pool.connection() as replacement:
+        assert replacement is not conn
+        replacement.execute("SELECT 1")
+    assert pool.stats().discarded == 1
+
+
+def test_release_rolls_back_open_transactions(fake_db):
+    pool = ConnectionPool(fake_db, size=1)
+    with pool.connection() as conn:
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO travel VALUES (1, 'CAN', 'USA', '2000-01-01', '')")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM travel").fetchone()[0] == 0
+
+
+def test_acquire_times_out_when_pool_is_exhausted(fake_db):
+    pool = ConnectionPool(fake_db, size=1, timeout=0.01)
+    with pool.connection():
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+    assert pool.stats().in_use == 0
@@ -0,0 +1,39 @@
+import pytest
+
+from folio.uow import PROFILES, Profile, TravelSQLiteUoW
+
+
+@pytest.mark.parametrize("name", PROFILES)
+def test_profiles_apply_their_pragmas(fake_db, name):
+    uow = TravelSQLiteUoW(fake_db, profile=name)
+    with uow:
+        uow.travel.list()
+
+    assert uow.settings["journal_mode"] == "wal"
+    assert uow.settings["cache_size"] == PROFILES[name].pragmas["cache_size"]
+
+
+def test_effective_settings_are_read_back(fake_db):
+    uow = TravelSQLiteUoW(fake_db, profile="bulk-load")
+    with uow:
+        synchronous = uow.conn.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert synchronous == uow.settings["synchronous"] == 0
+    assert uow.settings["temp_store"] == 2
+    assert uow.settings["wal_autocheckpoint"] == 10000
+
+
+def test_custom_profile_and_defaults(fake_db):
+    custom = Profile("small-cache", {"cache_size": -512})
+    with TravelSQLiteUoW(fake_db, profile=custom) as uow:
+        assert uow.conn.execute("PRAGMA cache_size").fetchone()[0] == -512
+
+    uow = TravelSQLiteUoW(fake_db)
+    with uow:
+        assert uow.conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    assert uow.settings == {}
+
+
+def test_unknown_profile_is_rejected(fake_db):
+    with pytest.raises(ValueError, match="Unknown profile"):
+        TravelSQLiteUoW(fake_db, profile="fastest")
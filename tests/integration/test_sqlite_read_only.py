@@ -0,0 +1,61 @@
+import pytest
+import sqlite3
+import datetime as dt
+
+from folio.models import Travel
+from folio.services import TravelService
+from folio.uow import TravelSQLiteUoW
+
+
+def test_read_only_unit_of_work_cannot_write(fake_db):
+    with TravelSQLiteUoW(fake_db, read_only=True) as uow:
+        assert uow.travel.list() == []
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+
+def test_service_reads_use_read_only_connections(fake_db):
+    uow = TravelSQLiteUoW(fake_db)
+    service = TravelService(uow)
+
+    service.add("CAN", "USA", "2000-01-01")
+    assert [t.destination for t in service.list()] == ["USA"]
+    assert service.find(origin="CAN")[0].date == dt.date(2000, 1, 1)
+
+    reader = uow.read_only()
+    assert reader is not uow and reader.pool.read_only
+    assert reader.read_only() is reader
+    assert uow.pool.stats().created == 1
+    assert reader.pool.stats().created == 1
+
+
+def test_read_only_inside_an_open_scope_is_the_scope_itself(fake_db):
+    uow = TravelSQLiteUoW(fake_db)
+    with uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        assert uow.read_only() is uow
+
+
+def test_readers_keep_a_snapshot_while_writers_commit(fake_db):
+    writer = TravelSQLiteUoW(fake_db, profile="balanced")
+    reader = writer.read_only()
+    with writer:
+        writer.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    with reader:
+        assert len(reader.travel.list()) == 1
+        with writer:
+            writer.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 2), ""))
+        assert len(reader.travel.list()) == 1
+
+    with reader:
+        assert len(reader.travel.list()) == 2
+
+
+def test_in_memory_databases_read_through_the_writer():
+    uow = TravelSQLiteUoW(":memory:")
+    service = TravelService(uow)
+
+    service.add("CAN", "USA", "2000-01-01")
+    assert [t.destination for t in service.list()] == ["USA"]
+    assert uow.read_only() is uow
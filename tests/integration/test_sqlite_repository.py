@@ -0,0 +1,488 @@
+import pytest
+import sqlite3
+import datetime as dt
+
+from folio.common import DuplicateRecordError, UnitOfWorkClosedError
+from folio.models import Address, Travel
+from folio.repositories import (
+    Index,
+    StatementCache,
+    StatementCacheStats,
+    SQLiteTravelRepository,
+    SQLiteEmploymentRepository,
+    SQLiteAddressRepository,
+    SQLiteWorkRepository,
+)
+from folio.uow import TravelSQLiteUoW, AddressSQLiteUoW
+
+
+def make_travels(count, start=dt.date(2000, 1, 1)):
+    return [
+        Travel(
+            origin="CAN",
+            destination="USA",
+            date=start + dt.timedelta(days=i),
+            notes=f"Trip {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def test_add_many_returns_ids_across_chunks(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        ids = uow.travel.add_many(make_travels(25), chunk_size=10)
+
+    assert ids == list(range(1, 26))
+    with TravelSQLiteUoW(fake_db) as uow:
+        assert len(uow.travel.list()) == 25
+
+
+def test_add_many_skip_ignores_duplicates(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3))
+
+    with TravelSQLiteUoW(fake_db) as uow:
+        ids = uow.travel.add_many(make_travels(5), on_conflict="skip")
+        assert len(uow.travel.list()) == 5
+
+    assert len(ids) == 2
+    assert min(ids) > 3
+
+
+def test_add_many_replace_overwrites_duplicates(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(2))
+
+    replacement = Travel("CAN", "USA", dt.date(2000, 1, 1), notes="Replaced")
+    with TravelSQLiteUoW(fake_db) as uow:
+        ids = uow.travel.add_many([replacement], on_conflict="replace")
+        notes = [t.notes for t in uow.travel.find(date=dt.date(2000, 1, 1))]
+
+    assert ids == [3]
+    assert notes == ["Replaced"]
+
+
+def test_add_many_fail_rolls_back_the_batch(fake_db):
+    travels = make_travels(3)
+    with pytest.raises(DuplicateRecordError):
+        with TravelSQLiteUoW(fake_db) as uow:
+            uow.travel.add_many(travels + travels[:1])
+
+    with TravelSQLiteUoW(fake_db) as uow:
+        assert uow.travel.list() == []
+
+
+def test_add_many_rejects_unknown_conflict_mode(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        with pytest.raises(ValueError):
+            uow.travel.add_many(make_travels(1), on_conflict="merge")
+
+
+def test_iter_list_streams_in_chunks(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(12))
+        travels = list(uow.travel.iter_list(chunk_size=5))
+
+    assert [t.notes for t in travels] == [f"Trip {i}" for i in range(12)]
+
+
+def test_iter_find_filters_rows(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(12))
+        travels = list(uow.travel.iter_find(chunk_size=5, date=dt.date(2000, 1, 3)))
+
+    assert [t.notes for t in travels] == ["Trip 2"]
+
+
+def test_iterators_fail_after_unit_of_work_closes(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(12))
+        travels = uow.travel.iter_list(chunk_size=5)
+        next(travels)
+
+    with pytest.raises(UnitOfWorkClosedError):
+        list(travels)
+
+    with pytest.raises(UnitOfWorkClosedError):
+        next(uow.travel.iter_find(origin="CAN"))
+
+
+def test_page_walks_all_records_by_id(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(7))
+        first = uow.travel.page(limit=3)
+        second = uow.travel.page(after=first.next_cursor, limit=3)
+        third = uow.travel.page(after=second.next_cursor, limit=3)
+
+    assert [t.notes for t in first] == ["Trip 0", "Trip 1", "Trip 2"]
+    assert [t.notes for t in second] == ["Trip 3", "Trip 4", "Trip 5"]
+    assert [t.notes for t in third] == ["Trip 6"]
+    assert third.next_cursor is None
+
+
+def test_page_orders_by_sortable_field_descending(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(5))
+        first = uow.travel.page(limit=2, order_by="-date")
+        second = uow.travel.page(after=first.next_cursor, limit=2, order_by="-date")
+
+    assert [t.notes for t in first] == ["Trip 4", "Trip 3"]
+    assert [t.notes for t in second] == ["Trip 2", "Trip 1"]
+
+
+def test_page_rejects_foreign_cursor_and_unsortable_field(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(5))
+        cursor = uow.travel.page(limit=2).next_cursor
+
+        with pytest.raises(ValueError):
+            uow.travel.page(after=cursor, order_by="date")
+        with pytest.raises(ValueError):
+            uow.travel.page(after="not-a-cursor")
+        with pytest.raises(ValueError):
+            uow.travel.page(order_by="notes")
+
+
+def test_query_pushes_range_and_in_filters_to_sql(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(10))
+        uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 4), notes="Detour"))
+
+        query = (
+            uow.travel.query()
+            .where(date__between=(dt.date(2000, 1, 3), dt.date(2000, 1, 6)))
+            .where(destination__in=["MEX", "USA"], notes__like="Trip%")
+            .order_by("-date")
+        )
+        notes = [t.notes for t in query]
+        count = query.count()
+
+    assert notes == ["Trip 5", "Trip 4", "Trip 3", "Trip 2"]
+    assert count == 4
+
+
+def test_query_is_lazy_and_sliceable(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        query = uow.travel.query().where(date__gte=dt.date(2000, 1, 5)).order_by("date")
+        uow.travel.add_many(make_travels(10))
+
+        window = query[1:3]
+        assert [t.notes for t in window] == ["Trip 5", "Trip 6"]
+        assert window.count() == 2
+        assert query[0].notes == "Trip 4"
+        assert query.limit(3).offset(5).all()[0].notes == "Trip 9"
+        assert query.where(notes__isnull=True).exists() is False
+        with pytest.raises(IndexError):
+            query[20]
+
+
+def test_query_slices_stay_within_a_limit(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(10))
+        query = uow.travel.query().order_by("date").limit(3)
+
+        assert len(query[0:10].all()) == 3
+        assert [t.notes for t in query[1:]] == ["Trip 1", "Trip 2"]
+        with pytest.raises(IndexError):
+            query[3]
+        assert query.offset(1).first().notes == "Trip 1"
+        assert query.limit(0).first() is None
+
+
+def test_query_rejects_unknown_fields_and_lookups(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        with pytest.raises(ValueError):
+            uow.travel.query().where(country="CAN")
+        with pytest.raises(ValueError):
+            uow.travel.query().where(date__around=dt.date(2000, 1, 1))
+        with pytest.raises(ValueError):
+            uow.travel.query().order_by("-country")
+
+
+def test_values_return_named_tuples_of_columns(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(2))
+        rows = uow.travel.query().order_by("date").values("destination", "date")
+
+    assert rows[0].destination == "USA"
+    assert rows[0].date == dt.date(2000, 1, 1)
+    assert rows[1] == ("USA", dt.date(2000, 1, 2))
+
+
+def test_values_list_flat_and_distinct(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3))
+        uow.travel.add(Travel("USA", "MEX", dt.date(2001, 1, 1), notes=""))
+
+        destinations = uow.travel.values_list("destination", flat=True, distinct=True)
+        pairs = (
+            uow.travel.query().where(destination="MEX").values_list("origin", "notes")
+        )
+
+        with pytest.raises(ValueError):
+            uow.travel.values_list("origin", "destination", flat=True)
+
+    assert sorted(destinations) == ["MEX", "USA"]
+    assert pairs == [("USA", "")]
+
+
+def test_count_and_exists_use_find_semantics(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(4))
+
+        assert uow.travel.count() == 4
+        assert uow.travel.count(origin="CAN", date=dt.date(2000, 1, 2)) == 1
+        assert uow.travel.exists(destination="USA", notes=None) is True
+        assert uow.travel.exists(destination="MEX") is False
+
+
+def test_aggregate_groups_in_sql(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3, start=dt.date(1999, 12, 31)))
+        uow.travel.add(Travel("USA", "MEX", dt.date(2001, 6, 1), notes=""))
+
+        summary = uow.travel.aggregate(
+            group_by=("destination", "date__year"),
+            metrics={"trips": "count", "last": ("max", "date")},
+        )
+        totals = uow.travel.aggregate(origin="CAN")
+
+        with pytest.raises(ValueError):
+            uow.travel.aggregate(metrics={"x": ("median", "date")})
+
+    assert summary == [
+        ("MEX", 2001, 1, dt.date(2001, 6, 1)),
+        ("USA", 1999, 1, dt.date(1999, 12, 31)),
+        ("USA", 2000, 2, dt.date(2000, 1, 2)),
+    ]
+    assert summary[0].date__year == 2001
+    assert summary[2].trips == 2
+    assert totals[0].count == 3
+
+
+def test_add_raises_duplicate_record_error_on_unique_conflict(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add(make_travels(1)[0])
+        with pytest.raises(DuplicateRecordError):
+            uow.travel.add(make_travels(1)[0])
+
+
+def test_check_constraint_failures_stay_integrity_errors(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        with pytest.raises(sqlite3.IntegrityError):
+            uow.travel.add(Travel("can", "USA", dt.date(2000, 1, 1), notes=""))
+
+
+def test_upsert_inserts_then_updates_in_place(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        first = uow.travel.upsert(Travel("CAN", "USA", dt.date(2000, 1, 1), "One"))
+        second = uow.travel.upsert(Travel("CAN", "USA", dt.date(2000, 1, 1), "Two"))
+        other = uow.travel.upsert(Travel("CAN", "MEX", dt.date(2000, 1, 1), "Three"))
+
+        assert first == second == 1
+        assert other > first
+        assert uow.travel.get(1).notes == "Two"
+        with pytest.raises(ValueError):
+            uow.travel.upsert(make_travels(1)[0], conflict_fields=("country",))
+
+
+def test_open_addresses_conflict_despite_a_null_end(fake_db, address_factory):
+    address = address_factory(end=None)
+    with AddressSQLiteUoW(fake_db) as uow:
+        first = uow.address.upsert(address)
+        second = uow.address.upsert(address)
+        uow.address.add_many([address, address], on_conflict="skip")
+
+        assert first == second
+        assert uow.address.count() == 1
+        with pytest.raises(DuplicateRecordError):
+            uow.address.add(address)
+
+
+def test_trusted_hydration_matches_constructed_records(fake_db, address_factory):
+    address = address_factory(end=None)
+    with AddressSQLiteUoW(fake_db) as uow:
+        uow.address.add(address)
+        (stored,) = uow.address.list()
+
+    assert stored == address
+    assert stored.end is None
+    assert stored.start == address.start
+    assert vars(stored) == vars(address)
+
+
+def test_update_by_key_is_checked_by_rowcount(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(2))
+
+        assert uow.travel.update(1, notes="Changed") == 1
+        with pytest.raises(ValueError):
+            uow.travel.update(99, notes="Missing")
+        assert uow.travel.get(1).notes == "Changed"
+
+
+def test_update_returning_yields_changed_records(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3))
+        uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 1), notes=""))
+
+        updated = uow.travel.update(
+            filters={"destination": "USA"}, notes="Bulk", returning=True
+        )
+
+    assert len(updated) == 3
+    assert {t.notes for t in updated} == {"Bulk"}
+    assert all(isinstance(t.date, dt.date) for t in updated)
+
+
+def test_update_many_batches_heterogeneous_changes(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(4))
+
+        updated = uow.travel.update_many(
+            [
+                (1, {"notes": "A"}),
+                (2, {"notes": "B"}),
+                (3, {"destination": "MEX", "notes": "C"}),
+                (99, {"notes": "Missing"}),
+            ]
+        )
+        travels = uow.travel.list()
+
+        with pytest.raises(ValueError):
+            uow.travel.update_many([(1, {"country": "CAN"})])
+
+    assert updated == 3
+    assert [(t.destination, t.notes) for t in travels] == [
+        ("USA", "A"),
+        ("USA", "B"),
+        ("MEX", "C"),
+        ("USA", "Trip 3"),
+    ]
+
+
+def test_delete_returning_hands_back_deleted_records(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3))
+
+        by_key = uow.travel.delete(1, returning=True)
+        by_fields = uow.travel.delete(destination="USA", returning=True)
+        nothing = uow.travel.delete(2, returning=True)
+
+    assert [t.notes for t in by_key] == ["Trip 0"]
+    assert [t.notes for t in by_fields] == ["Trip 1", "Trip 2"]
+    assert nothing == []
+
+
+def test_delete_many_uses_one_statement_for_any_number_of_ids(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(30))
+        uow.conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 7)
+
+        deleted = uow.travel.delete_many(range(1, 21))
+        before = uow.travel.statement_cache_stats()
+        assert uow.travel.delete_many([]) == 0
+        assert uow.travel.delete_many(range(100, 150)) == 0
+        assert uow.travel.statement_cache_stats().misses == before.misses
+        tombstones = uow.travel.delete_many([21, 22, 99], returning=True)
+        remaining = uow.travel.count()
+
+    assert deleted == 20
+    assert [t.notes for t in tombstones] == ["Trip 20", "Trip 21"]
+    assert remaining == 8
+
+
+def query_plan(conn, sql, params=()):
+    return " ".join(
+        row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    )
+
+
+def test_declared_indexes_serve_service_lookups(fake_db):
+    with AddressSQLiteUoW(fake_db) as uow:
+        open_plan = query_plan(uow.conn, "SELECT * FROM address WHERE end IS NULL")
+    with TravelSQLiteUoW(fake_db) as uow:
+        date_plan = query_plan(uow.conn, "SELECT * FROM travel WHERE date = ?", ("x",))
+
+    assert "address_open" in open_plan
+    assert "travel_date" in date_plan
+
+
+def test_index_supports_partial_and_expression_indexes(fake_db):
+    index = Index("travel_year", ("strftime('%Y', date)",), where="notes IS NOT NULL")
+
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.conn.execute(index.create_sql("travel"))
+        uow.conn.execute(index.create_sql("travel"))
+        names = [
+            row[0]
+            for row in uow.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'travel'"
+            )
+        ]
+
+    assert "travel_year" in names
+    assert index.create_sql("travel") == (
+        "CREATE INDEX IF NOT EXISTS travel_year ON travel (strftime('%Y', date)) "
+        "WHERE notes IS NOT NULL"
+    )
+
+
+def test_migrations_create_every_declared_index(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        created = {
+            row[0]
+            for row in uow.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        }
+
+    for repository in (
+        SQLiteTravelRepository,
+        SQLiteEmploymentRepository,
+        SQLiteAddressRepository,
+        SQLiteWorkRepository,
+    ):
+        for index in repository.INDEXES:
+            # sqlite_master keeps the statement without IF NOT EXISTS
+            sql = index.create_sql(repository._table)
+            assert sql.replace(" IF NOT EXISTS", "") in created
+
+
+def test_statements_are_compiled_once_per_filter_signature(fake_db):
+    with TravelSQLiteUoW(fake_db) as uow:
+        uow.travel.add_many(make_travels(3))
+        uow.travel.find(origin="CAN", date="2000-01-02")
+        before = uow.travel.statement_cache_stats()
+
+        # Same field set in another order, with other values
+        found = uow.travel.find(date=dt.date(2000, 1, 3), origin=" CAN ")
+        uow.travel.find(origin="CAN", date="2000-01-01")
+
+        after = uow.travel.statement_cache_stats()
+
+    assert [t.notes for t in found] == ["Trip 2"]
+    assert after.hits == before.hits + 2
+    assert after.misses == before.misses
+
+
+def test_update_filter_nullness_compiles_separate_statements(fake_db):
+    with AddressSQLiteUoW(fake_db) as uow:
+        for end in (None, dt.date(2001, 1, 1)):
+            uow.address.add(
+                Address(dt.date(2000, 1, 1), end, "1 St", "Vancouver", "BC", "CA", "V")
+            )
+
+        assert uow.address.update(filters={"end": None}, city="Open") == 1
+        assert uow.address.update(filters={"end": "2001-01-01"}, city="Closed") == 1
+
+        assert [a.city for a in uow.address.list()] == ["Open", "Closed"]
+
+
+def test_statement_cache_evicts_least_recently_used_entry():
+    cache = StatementCache(maxsize=2)
+    for key in ("a", "b", "a", "c", "a", "b"):
+        cache.get(key, str.upper, key)
+
+    # "b" was evicted for "c", while "a" stayed as it had just been used
+    assert cache.stats() == StatementCacheStats(hits=2, misses=4, size=2)
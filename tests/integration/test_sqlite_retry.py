@@ -0,0 +1,95 @@
+import pytest
+import sqlite3
+import datetime as dt
+import threading
+
+from folio.common import DuplicateRecordError
+from folio.models import Travel
+from folio.uow import RetryPolicy, SQLiteUnitOfWork
+
+
+@pytest.fixture
+def locked_db(fake_db):
+    with SQLiteUnitOfWork(fake_db):
+        pass
+    blocker = sqlite3.connect(fake_db, check_same_thread=False)
+    blocker.execute("BEGIN IMMEDIATE")
+    yield fake_db, blocker
+    blocker.close()
+
+
+def test_busy_transactions_are_retried_with_backoff(locked_db):
+    db, blocker = locked_db
+    policy = RetryPolicy(busy_timeout=0, max_attempts=50, max_total_wait=5)
+    uow = SQLiteUnitOfWork(db, immediate=True, retry=policy)
+    threading.Timer(0.05, blocker.commit).start()
+
+    with uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    stats = policy.stats()
+    assert stats.retries >= 1
+    assert stats.gave_up == 0
+    assert stats.blocked_time > 0
+
+
+def test_retries_stop_at_the_maximum_total_wait(locked_db):
+    db, _ = locked_db
+    policy = RetryPolicy(busy_timeout=0, max_attempts=1000, max_total_wait=0.05)
+    uow = SQLiteUnitOfWork(db, immediate=True, retry=policy)
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        with uow:
+            pass
+
+    stats = policy.stats()
+    assert stats.gave_up == 1
+    assert stats.blocked_time <= 0.1
+    assert uow.pool.stats().in_use == 0
+
+
+def test_other_errors_are_not_retried(fake_db):
+    policy = RetryPolicy()
+    with SQLiteUnitOfWork(fake_db, retry=policy) as uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        with pytest.raises(DuplicateRecordError):
+            uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    assert policy.stats().retries == 0
+    assert policy.stats().calls >= 3
+
+
+def test_stale_snapshots_are_not_retried(fake_db):
+    policy = RetryPolicy(busy_timeout=0)
+    uow = SQLiteUnitOfWork(fake_db, profile="balanced", retry=policy)
+
+    with pytest.raises(sqlite3.OperationalError) as error:
+        with uow:
+            uow.travel.list()
+            other = sqlite3.connect(fake_db)
+            with other:
+                other.execute(
+                    "INSERT INTO travel (origin, destination, date, notes)"
+                    " VALUES ('CAN', 'MEX', '2000-01-02', '')"
+                )
+            other.close()
+            uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    assert error.value.sqlite_errorcode == sqlite3.SQLITE_BUSY_SNAPSHOT
+    assert policy.stats().retries == 0
+    assert policy.stats().gave_up == 1
+
+
+def test_repository_statements_are_counted_but_not_retried(locked_db):
+    db, _ = locked_db
+    policy = RetryPolicy(busy_timeout=0.05)
+    uow = SQLiteUnitOfWork(db, retry=policy)
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        with uow:
+            uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+
+    stats = policy.stats()
+    assert stats.retries == 0
+    assert stats.gave_up == 1
+    assert stats.blocked_time >= 0.05
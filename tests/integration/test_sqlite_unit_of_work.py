@@ -0,0 +1,76 @@
+import pytest
+import datetime as dt
+
+from folio.common import UnitOfWorkClosedError
+from folio.models import Address, Travel
+from folio.services import TravelService
+from folio.uow import SQLiteUnitOfWork
+
+
+def test_domains_share_one_transaction(fake_db):
+    uow = SQLiteUnitOfWork(fake_db)
+    with pytest.raises(RuntimeError):
+        with uow:
+            uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+            uow.address.add(
+                Address(dt.date(2000, 1, 1), None, "1 St", "Vancouver", "BC", "CA", "V")
+            )
+            raise RuntimeError("abort")
+
+    with uow:
+        assert uow.travel.list() == []
+        assert uow.address.list() == []
+
+
+def test_repositories_are_created_lazily_per_scope(fake_db):
+    uow = SQLiteUnitOfWork(fake_db)
+    with uow:
+        travel = uow.travel
+        assert uow.travel is travel
+        assert list(uow._repositories) == ["travel"]
+
+    with uow:
+        assert uow.travel is not travel
+
+
+def test_repositories_are_unavailable_outside_a_scope(fake_db):
+    uow = SQLiteUnitOfWork(fake_db)
+    with pytest.raises(UnitOfWorkClosedError):
+        uow.travel
+
+    # Books have no SQLite repository yet
+    assert not hasattr(SQLiteUnitOfWork, "book")
+
+
+def test_nested_scopes_roll_back_to_their_savepoint(fake_db):
+    uow = SQLiteUnitOfWork(fake_db)
+    with uow:
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 1), ""))
+                raise RuntimeError("abort inner")
+        with uow.read_only() as reader:
+            assert reader is uow
+            assert [t.destination for t in reader.travel.list()] == ["USA"]
+
+    with uow:
+        assert len(uow.travel.list()) == 1
+
+
+def test_service_batch_commits_once(fake_db, monkeypatch):
+    uow = SQLiteUnitOfWork(fake_db)
+    service = TravelService(uow)
+    commits = []
+    commit = uow.commit
+    monkeypatch.setattr(uow, "commit", lambda: commits.append(commit()))
+
+    with service.batch():
+        for day in range(1, 29):
+            service.add("CAN", "USA", dt.date(2000, 2, day))
+        with pytest.raises(ValueError, match="already exists"):
+            service.add("CAN", "USA", dt.date(2000, 2, 1))
+        assert len(service.list()) == 28
+
+    assert len(commits) == 1
+    assert len(service.list()) == 28
@@ -0,0 +1,94 @@
+import pytest
+import datetime as dt
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from folio.models import Travel
+from folio.services import TravelService
+from folio.uow import SQLiteUnitOfWork, WriteCoordinator
+
+
+@pytest.fixture
+def coordinator(fake_db):
+    coordinator = WriteCoordinator(fake_db, readers=2, profile="balanced")
+    yield coordinator
+    coordinator.close()
+
+
+def test_concurrent_writers_are_serialized(coordinator):
+    def import_rows(thread):
+        for day in range(25):
+            date = dt.date(2000, 1, 1) + dt.timedelta(days=100 * thread + day)
+            coordinator.write(lambda uow: TravelService(uow).add("CAN", "USA", date))
+
+    with ThreadPoolExecutor(8) as threads:
+        list(threads.map(import_rows, range(8)))
+
+    assert coordinator.read(lambda uow: uow.travel.count()) == 200
+    stats = coordinator.stats()
+    assert (stats.submitted, stats.completed, stats.failed) == (200, 200, 0)
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth >= 1
+    assert stats.max_wait >= stats.mean_wait >= 0
+
+
+def test_reads_do_not_wait_for_the_writer(coordinator):
+    coordinator.write(
+        lambda uow: uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+    )
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write(uow):
+        uow.travel.add(Travel("CAN", "MEX", dt.date(2000, 1, 1), ""))
+        started.set()
+        release.wait(5)
+
+    pending = coordinator.submit(slow_write)
+    queued = coordinator.submit(lambda uow: uow.travel.count())
+    started.wait(5)
+
+    assert coordinator.read(lambda uow: uow.travel.count()) == 1
+    assert coordinator.stats().queue_depth == 1
+
+    release.set()
+    pending.result()
+    assert queued.result() == 2
+
+
+def test_failed_jobs_roll_back(coordinator):
+    def failing(uow):
+        uow.travel.add(Travel("CAN", "USA", dt.date(2000, 1, 1), ""))
+        raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError):
+        coordinator.write(failing)
+
+    assert coordinator.read(lambda uow: uow.travel.count()) == 0
+    assert coordinator.stats().failed == 1
+
+
+def test_closed_coordinator_rejects_jobs(fake_db):
+    coordinator = WriteCoordinator(fake_db)
+    coordinator.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        coordinator.submit(lambda uow: None)
+
+
+def test_immediate_units_of_work_wait_for_each_other(fake_db):
+    def write(thread):
+        uow = SQLiteUnitOfWork(fake_db, immediate=True)
+        for day in range(20):
+            date = dt.date(2000 + thread, 1, 1) + dt.timedelta(days=day)
+            with uow:
+                uow.travel.count()
+                uow.travel.add(Travel("CAN", "USA", date, ""))
+        uow.close()
+
+    with SQLiteUnitOfWork(fake_db, profile="balanced"):
+        pass
+    with ThreadPoolExecutor(4) as threads:
+        list(threads.map(write, range(4)))
+
+    with SQLiteUnitOfWork(fake_db) as uow:
+        assert uow.travel.count() == 80
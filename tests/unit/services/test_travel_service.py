@@ -70,3 +70,22 @@ def test_invalid_country_code_raises(fake_uow):
 
     with pytest.raises(ValueError):
         service.add(origin="USA", destination="FRANCE", date="2025-07-21")
+
+
+def test_batch_commits_once_at_the_end(fake_uow):
+    service = TravelService(fake_uow)
+
+    with service.batch():
+        service.add("CAN", "USA", "2000-01-01")
+        service.add("USA", "MEX", "2000-01-02")
+        assert fake_uow.committed is False
+
+    assert fake_uow.committed is True
+    assert len(service.list()) == 2
+
+
+def test_service_accepts_a_unit_of_work_factory(fake_uow):
+    service = TravelService(lambda: fake_uow)
+    service.add("CAN", "USA", "2000-01-01")
+    assert fake_uow.committed
+    assert service.list()[0].destination == "USA"